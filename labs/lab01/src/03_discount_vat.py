@@ -1,13 +1,169 @@
+"""
+Скидка и НДС: база после скидки, сумма НДС, итого.
+
+Без аргументов — как раньше, одна цена через input().
+Пакетный режим читает CSV со столбцами price,discount,vat (файл или stdin)
+и построчно пишет в stdout CSV с добавленными base,vat_amount,total:
+
+  python 03_discount_vat.py --batch prices.csv
+  cat prices.csv | python 03_discount_vat.py --batch - --mode decimal
+
+Режимы: float (быстрый), decimal (точный, для денег), numpy (векторно,
+кусками по --chunk строк; нужен numpy).
+"""
+import argparse
+import csv
+import sys
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from typing import Iterable, Iterator
+
+try:
+    import numpy as np
+except ImportError:  # numpy нужен только для --mode numpy
+    np = None
+
+COLUMNS = ("price", "discount", "vat")
+MODES = ("float", "decimal", "numpy")
+
+
+def calc(price, discount, vat) -> tuple:
+    """(base, vat_amount, total); работает и с float, и с Decimal"""
+    base = price * (1 - discount / 100)
+    vat_am = base * (vat / 100)
+    return base, vat_am, base + vat_am
+
+
+def calc_many(rows: Iterable[tuple], mode: str = "float") -> Iterator[tuple]:
+    """
+    Лениво считает calc для строк (price, discount, vat).
+    Значения — числа или строки; mode="decimal" переводит их в Decimal
+    через str, чтобы 0.1 оставалось ровно 0.1.
+    """
+    if mode == "float":
+        conv = float
+    elif mode == "decimal":
+        conv = lambda x: x if isinstance(x, Decimal) else Decimal(str(x))
+    else:
+        raise ValueError(f"Неизвестный режим: {mode}")
+    for price, discount, vat in rows:
+        yield calc(conv(price), conv(discount), conv(vat))
+
+
+def calc_arrays(prices, discounts, vats) -> tuple:
+    """Векторная версия calc: три массива numpy (float64) на входе и на выходе"""
+    if np is None:
+        raise ImportError("Для режима numpy нужен numpy: pip install numpy")
+    prices = np.asarray(prices, dtype=np.float64)
+    discounts = np.asarray(discounts, dtype=np.float64)
+    vats = np.asarray(vats, dtype=np.float64)
+    base = prices * (1 - discounts / 100)
+    vat_am = base * (vats / 100)
+    return base, vat_am, base + vat_am
+
+
+def _read_rows(f) -> Iterator[tuple[int, tuple[str, str, str]]]:
+    """(номер строки в файле, (price, discount, vat)); пустые строки пропускаются"""
+    reader = csv.reader(f)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("CSV без заголовка или пустой")
+    try:
+        idx = [header.index(name) for name in COLUMNS]
+    except ValueError:
+        raise ValueError(f"В заголовке нужны столбцы {','.join(COLUMNS)}") from None
+    need = max(idx) + 1
+    for row in reader:
+        if not row:
+            continue
+        if len(row) < need:
+            raise ValueError(f"Строка {reader.line_num}: столбцов {len(row)}, а в заголовке {len(header)}")
+        yield reader.line_num, tuple(row[i] for i in idx)
+
+
+def _bad_line(lines, part, mode: str) -> int:
+    """Номер первой строки куска, которую не удаётся перевести в числа"""
+    conv = (lambda x: Decimal(str(x))) if mode == "decimal" else float
+    for line, row in zip(lines, part):
+        try:
+            for x in row:
+                conv(x)
+        except (ValueError, InvalidOperation):
+            return line
+    return lines[0]
+
+
+def run_batch(src, dst, mode: str = "float", chunk: int = 65536) -> int:
+    """
+    Потоково: CSV из src -> CSV в dst. Возвращает число обработанных строк.
+    Нечисловое значение - ValueError с номером строки в файле.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk должен быть > 0")
+    writer = csv.writer(dst, lineterminator="\n")
+    writer.writerow(COLUMNS + ("base", "vat_amount", "total"))
+    rows = _read_rows(src)
+    count = 0
+    while numbered := list(islice(rows, chunk)):
+        lines, part = zip(*numbered)
+        try:
+            if mode == "numpy":
+                cols = calc_arrays(*zip(*part))
+                results = zip(*(c.tolist() for c in cols))
+            else:
+                results = list(calc_many(part, mode))
+        except (ValueError, InvalidOperation):
+            # кусок целиком не посчитался - ищем строку только в этом случае
+            raise ValueError(f"Строка {_bad_line(lines, part, mode)}: ожидались числа") from None
+        writer.writerows(row + res for row, res in zip(part, results))
+        count += len(part)
+    return count
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("нужно целое число > 0")
+    return value
+
+
 def main():
     try:
         pri: float = float(input("price="))
         dis: float = float(input("discount="))
         vat: float = float(input("vat="))
-        base: float = pri*(1-dis/100)
-        vat_am: float = base * (vat/100)
-        total: float = base + vat_am
+        base, vat_am, total = calc(pri, dis, vat)
         print(f"База после скидки: {base} ₽\nНДС: {vat_am} ₽\nИтого к оплате: {total} ₽")
     except Exception as e:
-        print(f"Шо, Опять? {e}")    
+        print(f"Шо, Опять? {e}")
+
+
+def cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Скидка и НДС для одной цены или CSV")
+    parser.add_argument("--batch", metavar="CSV", help="CSV price,discount,vat; '-' — stdin")
+    parser.add_argument("--mode", choices=MODES, default="float")
+    parser.add_argument("--chunk", type=_positive_int, default=65536, help="строк за один шаг")
+    args = parser.parse_args(argv)
+    if args.batch is None:
+        main()
+        return 0
+    try:
+        if args.batch == "-":
+            run_batch(sys.stdin, sys.stdout, args.mode, args.chunk)
+        else:
+            with open(args.batch, "r", encoding="utf-8", newline="") as f:
+                run_batch(f, sys.stdout, args.mode, args.chunk)
+    except FileNotFoundError as e:
+        print(f"Ошибка: файл не найден: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"Неверные данные: {e}", file=sys.stderr)
+        return 3
+    except ImportError as e:
+        print(f"Зависимость отсутствует: {e}", file=sys.stderr)
+        return 4
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(cli())
@@ -1,8 +1,104 @@
+"""
+Минуты -> часы:минуты.
+
+Без аргументов — как раньше, одно число через input().
+С --csv переводит целый столбец CSV (файл или '-' — stdin) и построчно
+пишет в stdout тот же CSV с добавленным столбцом <column>_hhmm:
+
+  python 04_minutes_to_hhmm.py --csv log.csv --column duration
+"""
+import argparse
+import csv
+import sys
+from array import array
+from itertools import islice, repeat
+from operator import floordiv, mod
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен
+    np = None
+
+
 def min2time(mins: int):
     min = mins%60
     hours = mins//60
     return {'min': min, 'hour': hours}
 
+
+def min2time_many(mins: Iterable[int], use_numpy: bool | None = None) -> tuple:
+    """
+    Пакетный min2time без словаря на каждое значение.
+    Возвращает (hours, minutes) — два упакованных массива:
+    array('q') на чистом Python или ndarray через numpy.divmod.
+    Значения вне int64 в них не влезают — тогда, как min2time, считается
+    на обычных int и возвращаются два list.
+    use_numpy: None - numpy только для входа ndarray, True - всегда, False - никогда.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None and isinstance(mins, np.ndarray)
+    elif use_numpy and np is None:
+        raise ImportError("Для use_numpy=True нужен numpy: pip install numpy")
+    if not isinstance(mins, (array, list, tuple)) and not (np is not None and isinstance(mins, np.ndarray)):
+        mins = list(mins)  # генератор нельзя пройти второй раз при откате
+    try:
+        if use_numpy:
+            return np.divmod(np.asarray(mins, dtype=np.int64), 60)
+        packed = mins if isinstance(mins, array) else array("q", mins)
+    except OverflowError:
+        mins = list(mins)
+        return list(map(floordiv, mins, repeat(60))), list(map(mod, mins, repeat(60)))
+    return array("q", map(floordiv, packed, repeat(60))), array("q", map(mod, packed, repeat(60)))
+
+
+def _bad_line(lines, rows, idx: int) -> int:
+    """Номер первой строки куска без целого числа в столбце idx"""
+    for line, row in zip(lines, rows):
+        try:
+            int(row[idx])
+        except (ValueError, IndexError):
+            return line
+    return lines[0]
+
+
+def run_column(src, dst, column: str, chunk: int = 65536) -> int:
+    """
+    Потоково добавляет столбец <column>_hhmm. Возвращает число строк.
+    Не целое значение или короткая строка - ValueError с номером строки в файле.
+    """
+    if chunk <= 0:
+        raise ValueError("chunk должен быть > 0")
+    reader = csv.reader(src)
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("CSV без заголовка или пустой")
+    if column not in header:
+        raise ValueError(f"Нет столбца {column}")
+    idx = header.index(column)
+    writer = csv.writer(dst, lineterminator="\n")
+    writer.writerow(header + [f"{column}_hhmm"])
+    # номер строки берётся после чтения: пустые строки пропускаются, но учитываются
+    numbered = ((reader.line_num, row) for row in reader if row)
+    count = 0
+    while part := list(islice(numbered, chunk)):
+        lines, rows = zip(*part)
+        try:
+            hours, minutes = min2time_many([int(row[idx]) for row in rows])
+        except (ValueError, IndexError):
+            raise ValueError(f"Строка {_bad_line(lines, rows, idx)}: ожидались целые минуты") from None
+        writer.writerows(row + [f"{h}:{m}"] for row, h, m in zip(rows, hours, minutes))
+        count += len(rows)
+    return count
+
+
+def _positive_int(text: str) -> int:
+    value = int(text)
+    if value <= 0:
+        raise argparse.ArgumentTypeError("нужно целое число > 0")
+    return value
+
+
 def main():
     try:
         result = min2time(int(input("Минуты: ")))
@@ -10,5 +106,30 @@ def main():
     except Exception as e:
         print(f"Да: {e}")
 
+
+def cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Минуты -> часы:минуты для числа или столбца CSV")
+    parser.add_argument("--csv", metavar="CSV", help="входной CSV; '-' — stdin")
+    parser.add_argument("--column", default="minutes", help="столбец с минутами")
+    parser.add_argument("--chunk", type=_positive_int, default=65536, help="строк за один шаг")
+    args = parser.parse_args(argv)
+    if args.csv is None:
+        main()
+        return 0
+    try:
+        if args.csv == "-":
+            run_column(sys.stdin, sys.stdout, args.column, args.chunk)
+        else:
+            with open(args.csv, "r", encoding="utf-8", newline="") as f:
+                run_column(f, sys.stdout, args.column, args.chunk)
+    except FileNotFoundError as e:
+        print(f"Ошибка: файл не найден: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"Неверные данные: {e}", file=sys.stderr)
+        return 3
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(cli())
@@ -1,4 +1,22 @@
+"""
+Подсчёт участников очно / заочно.
+
+Без аргументов — как раньше: число участников, затем строки
+"фамилия имя возраст true|false" через input().
+Потоковый режим читает файл или stdin ('-') построчно и держит в памяти
+только счётчики (и, с --hist, гистограммы возрастов по формату):
+
+  python 06-calc_partii.py --file people.txt --hist
+"""
+import argparse
+import sys
+from collections import Counter
+from itertools import chain, islice
+from typing import Iterable
+
+
 class Participant:
+    __slots__ = ("_name", "_sname", "_age", "_format")
     _name: str
     _sname: str
     _age: int
@@ -18,24 +36,75 @@ class Participant:
     def get_sname(self):
         return self._sname
     
+def parse_line(line: str) -> tuple[int, bool]:
+    """'фамилия имя возраст формат' -> (возраст, очно ли) без создания Participant"""
+    args = line.split()
+    return int(args[2]), args[3].lower() == "true"
+
+
+def tally(lines: Iterable[str], hist: bool = False) -> tuple[int, int, dict | None]:
+    """
+    Считает (очно, заочно, гистограммы) за один проход по строкам.
+    Если первая непустая строка — одно число, это количество участников
+    и читается ровно столько строк (как в интерактивном режиме).
+    Пустые строки пропускаются. hist=True — ещё {очно: Counter возрастов}.
+    """
+    counts = [0, 0]
+    ages = {True: Counter(), False: Counter()} if hist else None
+    it = iter(lines)
+    first = next((line for line in it if line.strip()), None)
+    if first is None:
+        return 0, 0, ages
+    if len(first.split()) == 1:
+        it = islice(it, int(first))
+    else:
+        it = chain((first,), it)
+    for line in it:
+        if not line.strip():
+            continue
+        age, ochno = parse_line(line)
+        counts[ochno] += 1
+        if ages is not None:
+            ages[ochno][age] += 1
+    return counts[1], counts[0], ages
+
+
 def main():
     try:
         cout = int(input())
-        List = []
-        for _ in range(cout):
-            args = input().split()
-            participant = Participant(
-                args[1],
-                args[0],
-                int(args[2]),
-                args[3].lower() == "true"
-            )
-            List.append(participant)
-
-        ochno = len([a for a in List if a.get_format() == True])
-        ne_ochno = len([a for a in List if a.get_format() == False])
+        ochno, ne_ochno, _ = tally(input() for _ in range(cout))
         print(f"out: {ochno} {ne_ochno}")
     except Exception as e:
         print(e)
+
+
+def cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Подсчёт участников очно / заочно")
+    parser.add_argument("--file", metavar="PATH", help="файл участников; '-' — stdin")
+    parser.add_argument("--hist", action="store_true", help="гистограмма возрастов по формату")
+    args = parser.parse_args(argv)
+    if args.file is None:
+        main()
+        return 0
+    try:
+        if args.file == "-":
+            ochno, ne_ochno, ages = tally(sys.stdin, args.hist)
+        else:
+            with open(args.file, "r", encoding="utf-8") as f:
+                ochno, ne_ochno, ages = tally(f, args.hist)
+    except FileNotFoundError as e:
+        print(f"Ошибка: файл не найден: {e}", file=sys.stderr)
+        return 2
+    except (ValueError, IndexError) as e:
+        print(f"Неверные данные: {e}", file=sys.stderr)
+        return 3
+    print(f"out: {ochno} {ne_ochno}")
+    if ages is not None:
+        for label, key in (("очно", True), ("заочно", False)):
+            for age, n in sorted(ages[key].items()):
+                print(f"{label} {age}: {n}")
+    return 0
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    raise SystemExit(cli())
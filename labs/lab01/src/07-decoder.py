@@ -1,23 +1,116 @@
-#ЛАДНО НАПИШУ
-#Но он не будет оптимальным
+"""
+Декодер: от первой заглавной буквы берётся каждый d-й символ до первой точки
+включительно; шаг d = (позиция первой цифры + 1) - позиция заглавной.
+
+Без аргументов — как раньше, одна строка через input().
+  python 07-decoder.py --file messages.txt   # по сообщению на строку, '-' — stdin
+  python 07-decoder.py --bench [N]           # старый посимвольный вариант против decode
+"""
+import argparse
 import re
-inp = input()
-fsymb: int
-ssymb: int
-d: int
-for i in range(len(inp)):
-    if re.match("([А-ЯA-Z])", inp[i]) != None:
-        fsymb = i
-        break
-
-for i in range(len(inp)):
-    if re.match("([0-9])", inp[i]) != None:
-        ssymb = i + 1
-        break
-d =(ssymb-fsymb)
-decoded: str = ""
-for i in range(fsymb, len(inp), d):
-    decoded = decoded + inp[i]
-    if(inp[i] == "."):
-        break
-print(decoded)
+import sys
+import timeit
+from typing import Iterable, Iterator
+
+_CAPITAL = re.compile("[А-ЯA-Z]")
+_DIGIT = re.compile("[0-9]")
+
+
+def decode(text: str) -> str:
+    capital = _CAPITAL.search(text)
+    digit = _DIGIT.search(text)
+    if capital is None or digit is None:
+        raise ValueError("В сообщении нет заглавной буквы или цифры")
+    start = capital.start()
+    step = digit.start() + 1 - start
+    if step == 0:
+        raise ValueError("Шаг равен нулю")
+    if step < 0:
+        # как range(start, len, step) с отрицательным шагом — пусто
+        return ""
+    decoded = text[start::step]
+    dot = decoded.find(".")
+    return decoded if dot == -1 else decoded[:dot + 1]
+
+
+def decode_many(lines: Iterable[str]) -> Iterator[str]:
+    """decode для каждой строки (перевод строки отрезается); ошибка — ValueError с номером"""
+    for line_no, line in enumerate(lines, start=1):
+        try:
+            yield decode(line.rstrip("\r\n"))
+        except ValueError as e:
+            raise ValueError(f"Строка {line_no}: {e}") from None
+
+
+def legacy_decode(inp: str) -> str:
+    """Старая версия: re.match на каждый символ и склейка строки в цикле"""
+    for i in range(len(inp)):
+        if re.match("([А-ЯA-Z])", inp[i]) != None:
+            fsymb = i
+            break
+    for i in range(len(inp)):
+        if re.match("([0-9])", inp[i]) != None:
+            ssymb = i + 1
+            break
+    d = (ssymb - fsymb)
+    decoded: str = ""
+    for i in range(fsymb, len(inp), d):
+        decoded = decoded + inp[i]
+        if(inp[i] == "."):
+            break
+    return decoded
+
+
+def bench(n: int = 100_000) -> None:
+    # худший случай для старой версии: длинный шум до заглавной буквы
+    # и длинное сообщение, точка только в самом конце
+    step = 7
+    prefix = "abcdefghij" * (n // 20)
+    payload = ["Q" + "5" * (step - 1)]
+    payload += ["x" * step] * (n // 2 // step)
+    text = prefix + "".join(payload) + "."
+    assert decode(text) == legacy_decode(text)
+    print(f"Сообщение {len(text)} символов, лучшее из 5, ms")
+    for label, func in (("legacy", legacy_decode), ("decode", decode)):
+        best = min(timeit.repeat(lambda: func(text), number=1, repeat=5))
+        print(f"{label:<24} {best * 1000:10.3f}")
+    lines = [text[-200:].replace("x", "Q5", 1)] * 10_000
+    for label, func in (("legacy 10000 x 200", lambda: [legacy_decode(x) for x in lines]),
+                        ("decode_many 10000 x 200", lambda: list(decode_many(lines)))):
+        best = min(timeit.repeat(func, number=1, repeat=5))
+        print(f"{label:<24} {best * 1000:10.3f}")
+
+
+def main():
+    print(decode(input()))
+
+
+def cli(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Декодер сообщений")
+    parser.add_argument("--file", metavar="PATH", help="сообщения по одному на строку; '-' — stdin")
+    parser.add_argument("--bench", nargs="?", type=int, const=100_000, metavar="N",
+                        help="бенчмарк на сообщении длиной ~N")
+    args = parser.parse_args(argv)
+    if args.bench is not None:
+        bench(args.bench)
+        return 0
+    if args.file is None:
+        main()
+        return 0
+    try:
+        if args.file == "-":
+            sys.stdout.writelines(s + "\n" for s in decode_many(sys.stdin))
+        else:
+            with open(args.file, "r", encoding="utf-8") as f:
+                sys.stdout.writelines(s + "\n" for s in decode_many(f))
+    except FileNotFoundError as e:
+        print(f"Ошибка: файл не найден: {e}", file=sys.stderr)
+        return 2
+    except ValueError as e:
+        print(f"Неверные данные: {e}", file=sys.stderr)
+        return 3
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(cli())
@@ -1,22 +1,60 @@
-def transpose(mat: list[list[float | int]]) -> list[list[float | int]] | type[ValueError]:
-    if not mat:
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен — всё работает и на чистом Python
+    np = None
+
+# use_numpy: None - numpy только для входа ndarray (ответ тоже ndarray),
+# True - списки тоже гоняются через numpy (ответ списком), False - только Python
+
+def _use_numpy(mat, use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return np is not None and isinstance(mat, np.ndarray)
+    if use_numpy and np is None:
+        raise ImportError("Для use_numpy=True нужен numpy: pip install numpy")
+    return use_numpy
+
+def _np_matrix(mat):
+    if isinstance(mat, np.ndarray):
+        return mat if mat.ndim == 2 else None
+    row_length = len(mat[0])
+    for item in mat:
+        if len(item) != row_length: return None
+    return np.asarray(mat)
+
+def _np_result(res, mat):
+    return res if isinstance(mat, np.ndarray) else res.tolist()
+
+def transpose(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[list[float | int]] | type[ValueError]:
+    if len(mat) == 0:
         return []
-    row_length = len(mat[0])    
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.T, mat)
+    row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    return [[row[i] for row in mat] for i in range(row_length)]
+    return [list(col) for col in zip(*mat)]
 
-def col_sum(mat: list[list[float | int]]) -> list[float] | type[ValueError]:
-    if not mat: return []
+def col_sum(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[float] | type[ValueError]:
+    if len(mat) == 0: return []
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.sum(axis=0), mat)
     row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    nmat = transpose(mat)
-    return [sum(arr) for arr in nmat] # type: ignore
+    # zip отдаёт столбцы по одному, полный транспонированный список не строится
+    return [sum(col) for col in zip(*mat)]
 
-def row_sum(mat: list[list[float | int]]) -> list[float] | type[ValueError]:
-    if not mat: return []
+def row_sum(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[float] | type[ValueError]:
+    if len(mat) == 0: return []
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.sum(axis=1), mat)
     row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    return [sum(arr) for arr in mat]
\ No newline at end of file
+    return list(map(sum, mat))
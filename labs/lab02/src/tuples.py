@@ -1,3 +1,7 @@
+import sys
+from typing import Iterable, TextIO
+
+
 def format_record(rec: tuple[str, str, float]) -> str | type[ValueError] | type[TypeError]:
     """
     Форматирует запись о студенте в строку вида:
@@ -25,10 +29,57 @@ def format_record(rec: tuple[str, str, float]) -> str | type[ValueError] | type[
     if not isinstance(rec[2], float) and not isinstance(rec[2], int): return TypeError('что ты сюда вписал?')
     try:
         n1,n2,n3 = rec[0].strip().split()
-        return f"{n1[0].upper() + n1[1:]} {n2[0].upper()}.{n3[0].upper().}., гр. {rec[1].upper()}, GPA {rec[2]:.2f}"
+        return f"{n1[0].upper() + n1[1:]} {n2[0].upper()}.{n3[0].upper()}., гр. {rec[1].upper()}, GPA {rec[2]:.2f}"
     except:
         pass
     try:
         n1,n2 = rec[0].strip().split()
         return f"{n1[0].upper() + n1[1:]} {n2[0].upper()}., гр. {rec[1].upper()}, GPA {rec[2]:.2f}"
     except Exception as e: print(e); return ValueError('Неверное ФИО')
+
+
+def format_records(records: Iterable[tuple[str, str, float]], stream: TextIO | None = None,
+                   batch: int = 4096) -> int:
+    """
+    Пакетный format_record: строки пишутся в stream (по умолчанию stdout)
+    за один проход, по batch строк за один write.
+
+    ФИО разбирается один раз, без try/except; верхний регистр группы
+    кэшируется (групп мало, записей много).
+
+    Возвращает число записанных строк.
+    Ошибки (ValueError / TypeError) выбрасываются с номером записи,
+    уже записанные строки остаются в stream.
+    """
+    if stream is None:
+        stream = sys.stdout
+    write = stream.write
+    groups: dict[str, str] = {}
+    lines = []
+    count = 0
+    for idx, (fio, group, gpa) in enumerate(records, start=1):
+        if len(group) == 0:
+            raise ValueError(f"Запись #{idx}: не указана группа")
+        if not isinstance(gpa, (float, int)):
+            raise TypeError(f"Запись #{idx}: GPA должен быть числом")
+        parts = fio.split()
+        if len(parts) == 3:
+            n1, n2, n3 = parts
+            name = f"{n1[0].upper()}{n1[1:]} {n2[0].upper()}.{n3[0].upper()}."
+        elif len(parts) == 2:
+            n1, n2 = parts
+            name = f"{n1[0].upper()}{n1[1:]} {n2[0].upper()}."
+        else:
+            raise ValueError(f"Запись #{idx}: неверное ФИО")
+        group_up = groups.get(group)
+        if group_up is None:
+            group_up = groups[group] = group.upper()
+        lines.append(f"{name}, гр. {group_up}, GPA {gpa:.2f}\n")
+        if len(lines) >= batch:
+            write("".join(lines))
+            count += len(lines)
+            lines.clear()
+    if lines:
+        write("".join(lines))
+        count += len(lines)
+    return count
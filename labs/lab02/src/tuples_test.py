@@ -4,3 +4,6 @@ print('Testing tuples')
 print("(\"Иванов Иван Иванович\", \"BIVT-25\", 4.6) Out:", tuples.format_record(("Иванов Иван Иванович", "BIVT-25", 4.6)))
 print("(\"Петров Пётр\", \"IKBO-12\", 5.0) Out:", tuples.format_record(("Петров Пётр", "IKBO-12", 5.0)))
 print("(\" сидорова анна сергеевна \", \"ABB-01\", 3.999) Out:", tuples.format_record((" сидорова анна сергеевна ", "ABB-01", 3.999)))
+
+print('Testing format_records')
+tuples.format_records([("Иванов Иван Иванович", "BIVT-25", 4.6), ("Петров Пётр", "ikbo-12", 5.0)])
@@ -1,4 +1,5 @@
 import os
+import sys
 from lib.text import *
 def format(top: list[tuple[str, int]]):
     '''
@@ -11,7 +12,7 @@ def format(top: list[tuple[str, int]]):
     Вход:
     list[tuple(key, val)]
     '''
-    length_of_words = max(len(word) for word, _ in top)
+    length_of_words = max((len(word) for word, _ in top), default=len('слово'))
     print(f"{'слово':<{length_of_words}} | {'частота'}")
     print('-' * (length_of_words + 12))
     for word, freq in top:
@@ -26,12 +27,23 @@ def no_format(top: list[tuple[str, int]]):
         print(f"{val[0]}: {val[1]}")
 
 def main():
+    """
+    Читает весь stdin кусками (не одной строкой в память) и за один проход
+    считает: всего слов, различных, встретившихся один раз (hapax) и топ-5.
+    FORMAT=TRUE — вывод топа таблицей.
+    APPROX=TRUE — для бесконечных потоков: фиксированная память (SketchStats),
+    различные слова и топ оцениваются приближённо, hapax не считается.
+    """
     isFormated: bool = True if os.getenv('FORMAT') == "TRUE" else False
-    tokenized_input: list = tokenize(input())
-    print(f"Всего слов: {len(tokenized_input)}")
-    freq: dict = count_freq(tokenized_input)
-    print(f"Всего уникальных слов: {len([k for k, v in freq.items() if v == 1])}")
+    isApprox: bool = True if os.getenv('APPROX') == "TRUE" else False
+    stats = SketchStats() if isApprox else WordStats()
+    for tokens in iter_token_chunks(sys.stdin):
+        stats.update(tokens)
+    print(f"Всего слов: {stats.total}")
+    print(f"Различных слов{' (≈)' if isApprox else ''}: {stats.distinct}")
+    if not isApprox:
+        print(f"Всего уникальных слов: {stats.hapax}")
     print("Топ-5:")
-    format(top_n(freq, 5)) if isFormated else no_format(top_n(freq, 5))
+    format(stats.top(5)) if isFormated else no_format(stats.top(5))
 if __name__ == "__main__":
     main()
\ No newline at end of file
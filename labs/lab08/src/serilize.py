@@ -1,12 +1,27 @@
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from operator import itemgetter
 from labs.lab09.src.models import Student
-from labs.lab09.src.checks import verify_type
+from labs.lab09.src.schema import TYPE_ERROR, validate_student
 
 def students_to_json(students, path):
     data = [s.to_dict() for s in students]
     with open(path, "w", encoding='utf-8') as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
 
+def _student_from_record(d):
+    """
+    Проверка одной записи и сборка Student (схема из labs.lab09.src.schema)
+    TypeError - неверные типы полей, ValueError - неверные значения.
+    В JSON gpa, как и раньше, должен быть float: схема Student пропускает
+    и int, поэтому здесь одно сравнение класса, остальное - один проход
+    валидатора в Student.__post_init__.
+    """
+    if isinstance(d, dict) and d.get('gpa').__class__ is not float:
+        raise TypeError(TYPE_ERROR)
+    return Student.from_dict(d)
+
 def students_from_json(path):
     with open(path, "r", encoding='utf-8') as f:
         data = json.load(f)
@@ -16,16 +31,96 @@ def students_from_json(path):
 
     student_list = []
     for d in data:
-        verify_type(d, dict)
-        verify_type(d.get('fio'), str)
-        verify_type(d.get('birthdate'), str)
-        verify_type(d.get('gpa'), float)
-        verify_type(d.get('group'), str)
+        student_list.append(_student_from_record(d))
+
+    return student_list
+
+_STUDENT_FIELDS = itemgetter('gpa', 'fio', 'birthdate', 'group')
+
+def _record_values(d):
+    """
+    Та же проверка, что в _student_from_record, но без сборки Student:
+    кортеж (gpa, fio, birthdate, group) дешевле гонять между процессами.
+    """
+    if isinstance(d, dict) and d.get('gpa').__class__ is not float:
+        raise TypeError(TYPE_ERROR)
+    validate_student(d)
+    return _STUDENT_FIELDS(d)
+
+def _load_chunk(start, chunk, raw):
+    """
+    Обработка одного куска записей (в процессе-воркере или в текущем).
+    start - индекс первого элемента куска в исходном файле,
+    raw=True - куски это строки NDJSON, которые ещё надо распарсить;
+    пустые строки пропускаются, но в нумерации учитываются.
+    Возвращает список кортежей значений для Student.from_valid.
+    Ошибки пробрасываются того же типа, но с местом записи:
+    "Запись #i" (индекс в массиве, с 0) или "Строка N" (NDJSON, с 1).
+    """
+    out = []
+    for idx, d in enumerate(chunk, start):
         try:
-            student = Student.from_dict(d)
-        except Exception as e:
-            raise ValueError
+            if raw:
+                if not d.strip():
+                    continue
+                d = json.loads(d)
+            out.append(_record_values(d))
+        except TypeError as e:
+            where = f"Строка {idx + 1}" if raw else f"Запись #{idx}"
+            raise TypeError(f"{where}: {str(e) or 'неверный тип'}") from None
+        except ValueError as e:
+            where = f"Строка {idx + 1}" if raw else f"Запись #{idx}"
+            raise ValueError(f"{where}: {str(e) or 'неверные данные'}") from None
+    return out
 
-        student_list.append(student)
+NDJSON_SUFFIXES = ('.ndjson', '.jsonl')
 
-    return student_list
\ No newline at end of file
+def _read_records(path):
+    """
+    Чтение файла: .ndjson/.jsonl -> (list[str] строк, True), иначе JSON-документ
+    -> (list[dict], False). Как и students_from_json, документ, который не
+    является массивом, даёт TypeError, а битый JSON - ValueError.
+    Строки NDJSON не парсятся здесь, это делают воркеры.
+    """
+    with open(path, "r", encoding='utf-8') as f:
+        text = f.read()
+    if os.path.splitext(str(path))[1].lower() in NDJSON_SUFFIXES:
+        return text.splitlines(), True
+    data = json.loads(text)
+    if not isinstance(data, list):
+        raise TypeError
+    return data, False
+
+def students_from_json_parallel(path, workers=None, chunk_size=10_000):
+    """
+    Загрузка студентов из JSON (массив) или NDJSON (.ndjson/.jsonl, объект
+    на строку) с разбором и проверкой в ProcessPoolExecutor.
+
+    Параллелится только NDJSON: воркерам уходят сырые строки кусками по
+    chunk_size, обратно - кортежи значений, Student собираются здесь без
+    повторной проверки (Student.from_valid), порядок исходный.
+    JSON-массив всё равно целиком разбирается в этом процессе, и отправка
+    словарей воркерам стоит дороже их проверки, поэтому он обрабатывается
+    без пула (замеры - serilize_bench.py). Без пула работает и NDJSON,
+    если в нём не больше одного куска или workers == 1.
+
+    Ошибки те же, что у students_from_json (TypeError / ValueError),
+    в сообщении указывается индекс записи (для NDJSON - номер строки).
+    """
+    if chunk_size <= 0:
+        raise ValueError('chunk_size должен быть > 0')
+    records, raw = _read_records(path)
+    build = Student.from_valid
+    workers = workers or os.cpu_count() or 1
+    if not raw or len(records) <= chunk_size or workers == 1:
+        return [build(*values) for values in _load_chunk(0, records, raw)]
+
+    starts = range(0, len(records), chunk_size)
+    chunks = [records[i:i + chunk_size] for i in starts]
+    student_list = []
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as ex:
+        # map отдаёт результаты по порядку, поэтому первой всплывёт
+        # ошибка из самого раннего куска
+        for part in ex.map(_load_chunk, starts, chunks, [raw] * len(chunks)):
+            student_list.extend([build(*values) for values in part])
+    return student_list
@@ -0,0 +1,91 @@
+"""Бенчмарк: students_from_json против students_from_json_parallel
+на JSON-массиве и NDJSON, плюс старая схема пула (словари воркерам,
+Student обратно) и доля работы, которая остаётся в родительском процессе.
+
+Запуск (из labs/lab08/src, как test.py):
+    PYTHONPATH=<корень репозитория>:<корень>/labs/lab09/src python serilize_bench.py [N] [WORKERS]
+"""
+
+import gc
+import json
+import os
+import pickle
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from serilize import (_load_chunk, _read_records, _student_from_record, students_from_json,
+                      students_from_json_parallel)
+from labs.lab09.src.models import Student
+
+
+def _legacy_chunk(chunk):
+    return [_student_from_record(d) for d in chunk]
+
+
+def legacy_parallel(path, workers, chunk_size=10_000):
+    """Прежний вариант: родитель парсит массив, воркерам - dict, обратно - Student"""
+    with open(path, "r", encoding="utf-8") as f:
+        records = json.load(f)
+    chunks = [records[i:i + chunk_size] for i in range(0, len(records), chunk_size)]
+    out = []
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        for part in ex.map(_legacy_chunk, chunks):
+            out.extend(part)
+    return out
+
+
+def timed(func, repeat: int = 3) -> float:
+    gc.disable()  # сборщик мусора на сотнях тысяч объектов даёт большой разброс
+    try:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+        return best
+    finally:
+        gc.enable()
+
+
+def main(n: int = 200_000, workers: int | None = None) -> None:
+    workers = workers or os.cpu_count() or 1
+    tmp = tempfile.mkdtemp()
+    array_path, ndjson_path = os.path.join(tmp, "students.json"), os.path.join(tmp, "students.ndjson")
+    records = [{"fio": f"Студент {i}", "birthdate": "2001-02-03", "gpa": (i % 50) / 10, "group": "BIVT-25"}
+               for i in range(n)]
+    with open(array_path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False, indent=2)
+    with open(ndjson_path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in records)
+    print(f"N = {n}, ядер: {os.cpu_count()}, воркеров: {workers}")
+
+    def row(label: str, seconds: float, base: float) -> None:
+        print(f"{label:<44} {seconds * 1000:9.1f} ms {base / seconds:7.2f}x")
+
+    print("\nJSON-массив")
+    base = timed(lambda: students_from_json(array_path))
+    row("students_from_json", base, base)
+    row(f"старый пул: dict -> воркеры -> Student ({workers})", timed(lambda: legacy_parallel(array_path, workers)), base)
+    row("students_from_json_parallel (без пула)", timed(lambda: students_from_json_parallel(array_path, workers)), base)
+
+    print("\nNDJSON")
+    base = timed(lambda: students_from_json_parallel(ndjson_path, 1))
+    row("в одном процессе (workers=1)", base, base)
+    for k in sorted({2, workers}):
+        row(f"students_from_json_parallel, воркеров {k}", timed(lambda: students_from_json_parallel(ndjson_path, k)), base)
+
+    # Родитель в любом случае читает файл, режет строки, отправляет их
+    # и собирает Student из кортежей - это потолок ускорения (закон Амдала)
+    lines = _read_records(ndjson_path)[0]
+    results = pickle.dumps(_load_chunk(0, lines, True), -1)  # это делают воркеры
+    parent = timed(lambda: (_read_records(ndjson_path), pickle.dumps(lines, -1),
+                            [Student.from_valid(*v) for v in pickle.loads(results)]))
+    print(f"{'доля родителя (чтение, pickle, сборка)':<44} {parent * 1000:9.1f} ms "
+          f"предел ускорения {base / parent:.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000,
+         int(sys.argv[2]) if len(sys.argv) > 2 else None)
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+from serilize import *
+
+# Проверки students_from_json_parallel против students_from_json
+tmp = tempfile.mkdtemp()
+
+def path(name):
+    return os.path.join(tmp, name)
+
+records = [
+    {"fio": f"Студент {i}", "birthdate": "2000-01-01", "gpa": (i % 50) / 10, "group": f"g{i % 3}"}
+    for i in range(25)
+]
+with open(path("students.json"), "w", encoding="utf-8") as f:
+    json.dump(records, f, ensure_ascii=False, indent=2)
+with open(path("students.ndjson"), "w", encoding="utf-8") as f:
+    for i, r in enumerate(records):
+        if i == 10:
+            f.write("\n")  # пустая строка учитывается в нумерации
+        f.write(json.dumps(r, ensure_ascii=False) + "\n")
+
+def fios(students):
+    return [s.fio for s in students]
+
+print('Testing order on chunk boundaries')
+serial = fios(students_from_json(path("students.json")))
+for chunk_size in (1, 4, 10, 24, 25, 100):
+    for workers in (1, 3):
+        arr = fios(students_from_json_parallel(path("students.json"), workers, chunk_size))
+        nd = fios(students_from_json_parallel(path("students.ndjson"), workers, chunk_size))
+        assert arr == serial and nd == serial, (chunk_size, workers)
+print(f"chunk_size 1..100, workers 1/3 Out: порядок как у students_from_json ({len(serial)} записей)")
+same = students_from_json_parallel(path("students.ndjson"), 2, 3) == students_from_json(path("students.json"))
+print("NDJSON через пул == students_from_json (поля Student) Out:", same)
+
+def error_of(func, *args):
+    try:
+        func(*args)
+    except (TypeError, ValueError) as e:
+        return f"{type(e).__name__}: {e}"
+    return "нет ошибки"
+
+print('\nTesting error types and indices')
+bad = [dict(r) for r in records]
+bad[13]["gpa"] = 7.0
+with open(path("bad_value.json"), "w", encoding="utf-8") as f:
+    json.dump(bad, f)
+print("gpa=7.0 в записи #13, chunk_size=4 Out:", error_of(students_from_json_parallel, path("bad_value.json"), 2, 4))
+
+bad = [dict(r) for r in records]
+bad[4]["fio"] = 1
+with open(path("bad_type.json"), "w", encoding="utf-8") as f:
+    json.dump(bad, f)
+print("fio=1 в записи #4 Out:", error_of(students_from_json_parallel, path("bad_type.json"), 2, 4))
+
+with open(path("bad_line.ndjson"), "w", encoding="utf-8") as f:
+    f.write(json.dumps(records[0]) + "\n\n{не json\n")
+print("битая строка 3 NDJSON (после пустой) Out:", error_of(students_from_json_parallel, path("bad_line.ndjson")))
+
+with open(path("bad_deep.ndjson"), "w", encoding="utf-8") as f:
+    for i, r in enumerate(records):
+        f.write(json.dumps({**r, "gpa": 4} if i == 17 else r) + "\n")
+print("gpa=4 (int) в строке 18 NDJSON, пул, chunk_size=4 Out:",
+      error_of(students_from_json_parallel, path("bad_deep.ndjson"), 2, 4))
+
+with open(path("object.json"), "w", encoding="utf-8") as f:
+    json.dump(records[0], f, indent=2)
+print("JSON-объект вместо массива, serial Out:", error_of(students_from_json, path("object.json")))
+print("JSON-объект вместо массива, parallel Out:", error_of(students_from_json_parallel, path("object.json")))
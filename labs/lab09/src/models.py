@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from checks import verify_date, verify_gpa, verify_type
+from operator import itemgetter
+from schema import TYPE_ERROR, validate_student
 from datetime import datetime
 
+# поля словаря в порядке полей Student - для позиционного вызова cls(...)
+_FIELDS = itemgetter("gpa", "fio", "birthdate", "group")
+
 @dataclass
 class Student:
     gpa: float
@@ -9,10 +13,9 @@ class Student:
     birthdate: str
     group: str
     
-    # Проверка в postinit
+    # Проверка в postinit — единственное место валидации (схема из schema.py)
     def __post_init__(self):
-        verify_gpa(self.gpa)
-        verify_date(self.birthdate)
+        validate_student(self.__dict__)
 
     # Экспорт данных оьекта в dict
     def to_dict(self) -> dict:
@@ -29,12 +32,29 @@ class Student:
 
     @classmethod
     def from_dict(cls, d: dict):
-        return cls(
-            fio=d["fio"],
-            birthdate=d["birthdate"],
-            group=d["group"],
-            gpa=d["gpa"],
-        )
+        """
+        Сборка Student из dict, проверка — в __post_init__ по схеме
+        TypeError - не dict / неверные типы, ValueError - gpa/дата вне формата
+        """
+        if d.__class__ is not dict and not isinstance(d, dict):
+            raise TypeError(TYPE_ERROR)
+        try:
+            return cls(*_FIELDS(d))
+        except KeyError:
+            raise TypeError(TYPE_ERROR) from None
+    @classmethod
+    def from_valid(cls, gpa, fio, birthdate, group):
+        """
+        Сборка без повторной проверки: значения уже прошли validate_student
+        (так serilize собирает записи, проверенные в процессах-воркерах)
+        """
+        self = object.__new__(cls)
+        self.gpa = gpa
+        self.fio = fio
+        self.birthdate = birthdate
+        self.group = group
+        return self
+
     # Возраст относительно даты или относительно тек времени
     def age(self, from_date = None)->int:
         """
@@ -0,0 +1,88 @@
+"""
+Схема записи и её сборка в один валидатор.
+
+Вместо цепочки verify_type / verify_gpa / verify_date на каждое поле
+схема один раз превращается в одну функцию без циклов: по проверке на
+поле подряд (как __init__ у dataclass). В исходник функции попадают только
+имена v0, k0, t0, ... - сами ключи, типы и границы лежат в её пространстве
+имён, так что любой ключ (с кавычками, переводами строк) безопасен.
+"""
+import datetime
+
+
+class Field:
+    """
+    Описание поля схемы
+    type - ожидаемый тип (или кортеж типов); bool не принимается за int,
+           если bool не указан явно
+    min, max - границы значения (включительно), None - без границы
+    date - строка должна быть датой YYYY-MM-DD
+    """
+    __slots__ = ("type", "min", "max", "date")
+
+    def __init__(self, type, min=None, max=None, date=False):
+        self.type = type
+        self.min = min
+        self.max = max
+        self.date = date
+
+
+# Порядок полей = порядок проверок типов (как раньше в serilize)
+STUDENT_SCHEMA = {
+    "fio": Field(str),
+    "birthdate": Field(str, date=True),
+    "gpa": Field((int, float), min=0, max=5),
+    "group": Field(str),
+}
+
+TYPE_ERROR = 'Неверный тип данных на входе'
+DATE_ERROR = 'Неверный формат даты'
+
+
+def compile_schema(schema: dict):
+    """
+    Собирает схему {поле: Field} в функцию validate(d) -> d
+    Сначала проверяются типы всех полей (TypeError), затем границы,
+    затем даты (ValueError) - тот же порядок ошибок, что и у старой цепочки
+    verify_type -> verify_gpa -> verify_date.
+    """
+    ns = {"isinstance": isinstance, "dict": dict, "bool": bool,
+          "fromisoformat": datetime.date.fromisoformat,
+          "TYPE_ERROR": TYPE_ERROR, "DATE_ERROR": DATE_ERROR}
+    lines = ["def validate(d):",
+             "    if d.__class__ is not dict and not isinstance(d, dict):",
+             "        raise TypeError(TYPE_ERROR)",
+             "    try:"]
+    lines += [f"        v{i} = d[k{i}]" for i in range(len(schema))] or ["        pass"]
+    # нет поля - как None у d.get: неверный тип
+    lines += ["    except KeyError:",
+              "        raise TypeError(TYPE_ERROR) from None"]
+    bounds, dates = [], []
+    for i, (key, f) in enumerate(schema.items()):
+        types = f.type if isinstance(f.type, tuple) else (f.type,)
+        ns[f"k{i}"], ns[f"t{i}"] = key, types[0] if len(types) == 1 else types
+        # быстрый путь - точное совпадение класса, isinstance только для подклассов
+        same = f"is not t{i}" if len(types) == 1 else f"not in t{i}"
+        lines.append(f"    if v{i}.__class__ {same} and not isinstance(v{i}, t{i}):")
+        lines.append("        raise TypeError(TYPE_ERROR)")
+        if bool not in types and isinstance(True, types):
+            lines.append(f"    if v{i}.__class__ is bool:")
+            lines.append("        raise TypeError(TYPE_ERROR)")
+        if f.min is not None or f.max is not None:
+            ns[f"lo{i}"], ns[f"hi{i}"] = f.min, f.max
+            cond = " or ".join(c for c in (f.min is not None and f"v{i} < lo{i}",
+                                           f.max is not None and f"v{i} > hi{i}") if c)
+            bounds += [f"    if {cond}:",
+                       f"        raise ValueError(f'Выход за границы {{k{i}}}')"]
+        if f.date:
+            dates += ["    try:",
+                      f"        fromisoformat(v{i})",
+                      "    except ValueError:",
+                      "        raise ValueError(DATE_ERROR) from None"]
+    lines += bounds + dates
+    lines.append("    return d")
+    exec("\n".join(lines), ns)
+    return ns["validate"]
+
+
+validate_student = compile_schema(STUDENT_SCHEMA)
@@ -0,0 +1,87 @@
+"""Бенчмарк: скомпилированный validate_student против старой цепочки
+verify_type / verify_gpa / verify_date и Student.from_dict до и после.
+
+Запуск:
+    python schema_bench.py [N]
+"""
+
+import gc
+import sys
+import timeit
+from dataclasses import dataclass
+
+from checks import verify_date, verify_gpa, verify_type
+from models import Student
+from schema import validate_student
+
+
+def legacy_validate(d: dict) -> dict:
+    """Старая цепочка serilize + __post_init__: по вызову на поле"""
+    verify_type(d, dict)
+    verify_type(d.get('fio'), str)
+    verify_type(d.get('birthdate'), str)
+    verify_type(d.get('gpa'), float)
+    verify_type(d.get('group'), str)
+    verify_gpa(d['gpa'])
+    verify_date(d['birthdate'])
+    return d
+
+
+@dataclass
+class LegacyStudent:
+    """Student до схемы: from_dict по ключам, в __post_init__ только gpa и дата"""
+    gpa: float
+    fio: str
+    birthdate: str
+    group: str
+
+    def __post_init__(self):
+        verify_gpa(self.gpa)
+        verify_date(self.birthdate)
+
+    @classmethod
+    def from_dict(cls, d: dict):
+        return cls(fio=d["fio"], birthdate=d["birthdate"], group=d["group"], gpa=d["gpa"])
+
+
+def legacy_record(d: dict) -> LegacyStudent:
+    """Старый _student_from_record: проверки типов, затем from_dict"""
+    verify_type(d, dict)
+    verify_type(d.get('fio'), str)
+    verify_type(d.get('birthdate'), str)
+    verify_type(d.get('gpa'), float)
+    verify_type(d.get('group'), str)
+    return LegacyStudent.from_dict(d)
+
+
+def bench(label: str, func, n: int, repeat: int = 5) -> float:
+    gc.disable()  # сборщик мусора на списках объектов даёт большой разброс
+    try:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+    finally:
+        gc.enable()
+    print(f"{label:<44} {best * 1000:8.1f} ms {best / n * 1e9:8.0f} ns/запись")
+    return best
+
+
+def main(n: int = 200_000) -> None:
+    records = [{"fio": f"Студент {i}", "birthdate": "2001-02-03", "gpa": (i % 50) / 10, "group": "BIVT-25"}
+               for i in range(n)]
+    print(f"N = {n}")
+
+    print("\nТолько проверка записи")
+    old = bench("verify_type x5 + verify_gpa + verify_date", lambda: [legacy_validate(d) for d in records], n)
+    new = bench("validate_student", lambda: [validate_student(d) for d in records], n)
+    print(f"{'ускорение':<44} {old / new:8.2f}x")
+
+    print("\nЗапись -> Student (serilize: типы + from_dict)")
+    old = bench("старая цепочка + from_dict", lambda: [legacy_record(d) for d in records], n)
+    new = bench("Student.from_dict (одна проверка)", lambda: [Student.from_dict(d) for d in records], n)
+    print(f"{'ускорение':<44} {old / new:8.2f}x")
+    # старый from_dict сам по себе типы не проверял - для сравнения
+    old = bench("старый from_dict без проверки типов", lambda: [LegacyStudent.from_dict(d) for d in records], n)
+    print(f"{'ускорение':<44} {old / new:8.2f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -5,8 +5,18 @@
 - SinglyLinkedList хранит head и tail для O(1) append.
 - Поддерживается append, prepend, insert, remove (по значению),
   remove_at (по индексу), итерация, len и удобный вывод.
+- PersistentList — неизменяемый cons-список: prepend за O(1) с общим
+  хвостом между версиями, снимок — это просто ссылка.
+- DoublyLinkedList — двусвязный список, append/prepend отдают узел,
+  по которому unlink и move_to_front работают за O(1).
+- IndexedLinkedList — тот же API на skip list с ширинами ссылок,
+  позиционный доступ O(log n) вместо прохода от head.
+- UnrolledLinkedList — узел хранит блок значений, а не одно:
+  меньше объектов в памяти и быстрее итерация.
 """
 
+import random
+from itertools import islice
 from typing import Any, Iterator, Optional
 
 
@@ -33,6 +43,9 @@ class SinglyLinkedList:
       - insert(idx, value)  O(min(idx, n)) — проход от головы
       - remove(value)       O(n) — удаление первого вхождения (ValueError если не найдено)
       - remove_at(idx)      O(n) — удаление по индексу (IndexError при некорректном индексе)
+      - extend(iterable)    O(k) — цепочка собирается целиком и подвешивается к tail
+      - concat(other)       O(1) — забирает узлы other, other становится пустым
+      - split_at(idx)       O(idx) — отрезает хвост [idx:] в новый список
       - __iter__, __len__, __repr__, __str__
     """
 
@@ -43,8 +56,7 @@ class SinglyLinkedList:
         self.tail: Optional[Node] = None
         self._size: int = 0
         if iterable:
-            for v in iterable:
-                self.append(v)
+            self.extend(iterable)
 
     def append(self, value: Any) -> None:
         """Добавить в конец — O(1)."""
@@ -66,6 +78,63 @@ class SinglyLinkedList:
             self.tail = node
         self._size += 1
 
+    def extend(self, iterable) -> None:
+        """Добавить все значения в конец — O(k).
+
+        Цепочка строится с конца (Node(v, next)), без проверок head/tail
+        и счётчика на каждый элемент, а потом целиком цепляется к tail.
+        """
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        if not values:
+            return
+        last = Node(values[-1])
+        first = last
+        for v in islice(reversed(values), 1, None):
+            first = Node(v, first)
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+        self.tail = last
+        self._size += len(values)
+
+    def concat(self, other: "SinglyLinkedList") -> None:
+        """Приклеить other в конец — O(1). Узлы переходят к self, other пустеет."""
+        if other is self:
+            raise ValueError("concat: cannot concat list with itself")
+        if other.head is None:
+            return
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self._size += other._size
+        other.head = other.tail = None
+        other._size = 0
+
+    def split_at(self, idx: int) -> "SinglyLinkedList":
+        """Отрезать элементы [idx:] в новый список — O(idx). Допускаются 0 и len."""
+        if idx < 0 or idx > self._size:
+            raise IndexError("split_at index out of range")
+        rest = SinglyLinkedList()
+        if idx == self._size:
+            return rest
+        if idx == 0:
+            rest.head, rest.tail, rest._size = self.head, self.tail, self._size
+            self.head = self.tail = None
+            self._size = 0
+            return rest
+        prev = self.head
+        for _ in range(idx - 1):
+            prev = prev.next  # type: ignore
+        assert prev is not None
+        rest.head, rest.tail, rest._size = prev.next, self.tail, self._size - idx
+        prev.next = None
+        self.tail = prev
+        self._size = idx
+        return rest
+
     def insert(self, idx: int, value: Any) -> None:
         """Вставить по индексу. Допускаются idx==0 и idx==len."""
         if idx < 0 or idx > self._size:
@@ -143,19 +212,573 @@ class SinglyLinkedList:
         parts.append("None")
         return " -> ".join(parts)
 
-sll = SinglyLinkedList()
-print(f'Длина нашего односвязанного списка : {len(sll)}')
 
-sll.append(1)
-sll.append(2)
-sll.prepend(0)
-print(f'Наша ныняшняя длина списка после добавления эллементов : {len(sll)}') 
-print(f'Односвязаный список : {list(sll)}')
 
-sll.insert(1, 0.5)
-print(f'Длина списка после добавления на 1 индекс числа 0.5 : {len(sll)}')
-print(f'Односвязаный список : {list(sll)}')
-sll.append(52)
-print(f'Односвязанный список после добавления числа в конец : {list(sll)}')
 
-print(sll) 
\ No newline at end of file
+class PersistentList:
+    """Неизменяемый (персистентный) односвязный cons-список.
+
+    Каждая версия — это просто ссылка на свою голову; prepend создаёт один
+    новый узел, а хвост разделяется со старой версией. Поэтому «снимок»
+    списка бесплатен (это та же ссылка), а память растёт только на число
+    новых узлов. Методов изменения нет — каждая операция возвращает новую версию.
+
+    Методы:
+      - prepend(value) -> PersistentList  O(1)
+      - first                             O(1) (IndexError если пуст)
+      - rest -> PersistentList            O(1) (IndexError если пуст)
+      - from_iterable(iterable)           O(n), classmethod
+      - to_list()                         O(n)
+      - __iter__, __len__ (O(1)), __eq__, __hash__, __repr__, __str__
+    """
+
+    __slots__ = ("_value", "_next", "_size")
+
+    def __init__(self, iterable=None) -> None:
+        self._value: Any = None
+        self._next: Optional["PersistentList"] = None
+        self._size: int = 0
+        if iterable:
+            built = PersistentList.from_iterable(iterable)
+            self._value, self._next, self._size = built._value, built._next, built._size
+
+    @classmethod
+    def from_iterable(cls, iterable) -> "PersistentList":
+        values = iterable if isinstance(iterable, (list, tuple)) else list(iterable)
+        node = cls()
+        for v in reversed(values):
+            node = node.prepend(v)
+        return node
+
+    def prepend(self, value: Any) -> "PersistentList":
+        """Новая версия с value в начале — O(1), хвост общий с self."""
+        node = PersistentList.__new__(PersistentList)
+        node._value = value
+        node._next = self
+        node._size = self._size + 1
+        return node
+
+    @property
+    def first(self) -> Any:
+        if not self._size:
+            raise IndexError("first of empty PersistentList")
+        return self._value
+
+    @property
+    def rest(self) -> "PersistentList":
+        if not self._size:
+            raise IndexError("rest of empty PersistentList")
+        return self._next  # type: ignore
+
+    def to_list(self) -> list[Any]:
+        return list(self)
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self
+        while node._size:
+            yield node._value
+            node = node._next  # type: ignore
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PersistentList):
+            return NotImplemented
+        a, b = self, other
+        if a._size != b._size:
+            return False
+        # общий хвост дальше можно не сравнивать
+        while a is not b and a._size:
+            if a._value != b._value:
+                return False
+            a, b = a._next, b._next  # type: ignore
+        return True
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        return f"PersistentList([{', '.join(repr(x) for x in self)}])"
+
+    def __str__(self) -> str:
+        parts = [f"[{v!s}]" for v in self]
+        parts.append("None")
+        return " -> ".join(parts)
+
+
+class DNode:
+    __slots__ = ("value", "prev", "next")
+
+    def __init__(self, value: Any, prev: Optional["DNode"] = None, next: Optional["DNode"] = None) -> None:
+        self.value = value
+        self.prev = prev
+        self.next = next
+
+    def __repr__(self) -> str:
+        return f"DNode({self.value!r})"
+
+
+class DoublyLinkedList:
+    """Двусвязный список с дескрипторами узлов.
+
+    append/prepend возвращают сам узел (DNode) — по нему потом можно за O(1)
+    удалить элемент или переставить его в начало, без поиска по списку.
+    Узел должен принадлежать именно этому списку — это не проверяется.
+
+    Методы:
+      - append(value) -> DNode      O(1)
+      - prepend(value) -> DNode     O(1)
+      - unlink(node) -> value       O(1)
+      - move_to_front(node)         O(1)
+      - pop() / popleft() -> value  O(1) (IndexError если пуст)
+      - remove(value)               O(n) — первое вхождение (ValueError если не найдено)
+      - __iter__, __len__, __repr__, __str__
+    """
+
+    __slots__ = ("head", "tail", "_size")
+
+    def __init__(self, iterable=None) -> None:
+        self.head: Optional[DNode] = None
+        self.tail: Optional[DNode] = None
+        self._size: int = 0
+        if iterable:
+            for v in iterable:
+                self.append(v)
+
+    def append(self, value: Any) -> DNode:
+        """Добавить в конец — O(1)."""
+        node = DNode(value, prev=self.tail)
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self._size += 1
+        return node
+
+    def prepend(self, value: Any) -> DNode:
+        """Добавить в начало — O(1)."""
+        node = DNode(value, next=self.head)
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        self._size += 1
+        return node
+
+    def _detach(self, node: DNode) -> None:
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+    def unlink(self, node: DNode) -> Any:
+        """Удалить узел по дескриптору — O(1). Возвращает его значение."""
+        self._detach(node)
+        node.prev = node.next = None
+        self._size -= 1
+        return node.value
+
+    def move_to_front(self, node: DNode) -> None:
+        """Переставить узел в начало — O(1)."""
+        if node is self.head:
+            return
+        self._detach(node)
+        node.prev = None
+        node.next = self.head
+        assert self.head is not None
+        self.head.prev = node
+        self.head = node
+
+    def pop(self) -> Any:
+        """Снять с конца — O(1)."""
+        if self.tail is None:
+            raise IndexError("pop from empty DoublyLinkedList")
+        return self.unlink(self.tail)
+
+    def popleft(self) -> Any:
+        """Снять с начала — O(1)."""
+        if self.head is None:
+            raise IndexError("pop from empty DoublyLinkedList")
+        return self.unlink(self.head)
+
+    def remove(self, value: Any) -> None:
+        """Удалить первое вхождение value. Если не найдено — ValueError."""
+        cur = self.head
+        while cur:
+            if cur.value == value:
+                self.unlink(cur)
+                return
+            cur = cur.next
+        raise ValueError("remove: value not found in DoublyLinkedList")
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self.head
+        while cur:
+            yield cur.value
+            cur = cur.next
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"DoublyLinkedList([{', '.join(repr(x) for x in self)}])"
+
+    def __str__(self) -> str:
+        parts = ["None"]
+        parts.extend(f"[{v!s}]" for v in self)
+        parts.append("None")
+        return " <-> ".join(parts)
+
+
+class SkipNode:
+    __slots__ = ("value", "next", "width")
+
+    def __init__(self, value: Any, level: int) -> None:
+        self.value = value
+        # next[i] — следующий узел на уровне i, width[i] — сколько позиций он перепрыгивает
+        self.next: list[Optional["SkipNode"]] = [None] * level
+        self.width: list[int] = [1] * level
+
+    def __repr__(self) -> str:
+        return f"SkipNode({self.value!r})"
+
+
+class IndexedLinkedList:
+    """Индексируемый список на skip list с ширинами ссылок.
+
+    Тот же API, что у SinglyLinkedList, но позиционный доступ за O(log n)
+    в среднем: каждая ссылка уровня i помнит, через сколько элементов
+    она перепрыгивает, так что спуск по уровням сразу находит индекс.
+    Ссылка «в никуда» считается ведущей на позицию len(self).
+
+    Методы:
+      - append(value), prepend(value)  O(log n)
+      - insert(idx, value)             O(log n)
+      - remove_at(idx)                 O(log n)
+      - remove(value)                  O(n) — поиск значения, затем remove_at
+      - __getitem__ / __setitem__      O(log n) (IndexError при неверном индексе)
+      - __iter__, __len__, __repr__, __str__
+    """
+
+    MAX_LEVEL = 32
+
+    __slots__ = ("_head", "_level", "_size", "_random")
+
+    def __init__(self, iterable=None) -> None:
+        self._head = SkipNode(None, self.MAX_LEVEL)
+        self._level = 1
+        self._size = 0
+        self._random = random.random
+        if iterable:
+            for v in iterable:
+                self.append(v)
+
+    def _random_level(self) -> int:
+        level = 1
+        rnd = self._random
+        while level < self.MAX_LEVEL and rnd() < 0.5:
+            level += 1
+        return level
+
+    def _find(self, idx: int) -> tuple[list[SkipNode], list[int]]:
+        """Предшественники позиции idx на каждом уровне и их позиции."""
+        preds: list[SkipNode] = [self._head] * self._level
+        positions = [-1] * self._level
+        node, pos = self._head, -1
+        for lvl in range(self._level - 1, -1, -1):
+            while pos + node.width[lvl] < idx:
+                pos += node.width[lvl]
+                node = node.next[lvl]  # type: ignore
+            preds[lvl] = node
+            positions[lvl] = pos
+        return preds, positions
+
+    def _node_at(self, idx: int) -> SkipNode:
+        if idx < 0:
+            idx += self._size
+        if idx < 0 or idx >= self._size:
+            raise IndexError("IndexedLinkedList index out of range")
+        node, pos = self._head, -1
+        for lvl in range(self._level - 1, -1, -1):
+            while pos + node.width[lvl] <= idx:
+                pos += node.width[lvl]
+                node = node.next[lvl]  # type: ignore
+        return node
+
+    def append(self, value: Any) -> None:
+        self.insert(self._size, value)
+
+    def prepend(self, value: Any) -> None:
+        self.insert(0, value)
+
+    def insert(self, idx: int, value: Any) -> None:
+        """Вставить по индексу. Допускаются idx==0 и idx==len."""
+        if idx < 0 or idx > self._size:
+            raise IndexError("insert index out of range")
+        level = self._random_level()
+        if level > self._level:
+            # новые уровни головы ведут «в никуда», т.е. на позицию size
+            for lvl in range(self._level, level):
+                self._head.next[lvl] = None
+                self._head.width[lvl] = self._size + 1
+            self._level = level
+        preds, positions = self._find(idx)
+        node = SkipNode(value, level)
+        for lvl in range(level):
+            pred = preds[lvl]
+            # старый сосед был на positions+width, после вставки сдвинется на +1
+            node.next[lvl] = pred.next[lvl]
+            node.width[lvl] = positions[lvl] + pred.width[lvl] + 1 - idx
+            pred.next[lvl] = node
+            pred.width[lvl] = idx - positions[lvl]
+        for lvl in range(level, self._level):
+            preds[lvl].width[lvl] += 1
+        self._size += 1
+
+    def remove_at(self, idx: int) -> None:
+        """Удалить элемент по индексу. Возбуждает IndexError при неверном индексе."""
+        if idx < 0 or idx >= self._size:
+            raise IndexError("remove_at index out of range")
+        preds, _ = self._find(idx)
+        target = preds[0].next[0]
+        assert target is not None
+        for lvl in range(self._level):
+            pred = preds[lvl]
+            if pred.next[lvl] is target:
+                pred.next[lvl] = target.next[lvl]
+                pred.width[lvl] += target.width[lvl] - 1
+            else:
+                pred.width[lvl] -= 1
+        self._size -= 1
+
+    def remove(self, value: Any) -> None:
+        """Удалить первое вхождение value. Если не найдено — ValueError."""
+        for idx, v in enumerate(self):
+            if v == value:
+                self.remove_at(idx)
+                return
+        raise ValueError("remove: value not found in IndexedLinkedList")
+
+    def __getitem__(self, idx: int) -> Any:
+        return self._node_at(idx).value
+
+    def __setitem__(self, idx: int, value: Any) -> None:
+        self._node_at(idx).value = value
+
+    def __iter__(self) -> Iterator[Any]:
+        cur = self._head.next[0]
+        while cur:
+            yield cur.value
+            cur = cur.next[0]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"IndexedLinkedList([{', '.join(repr(x) for x in self)}])"
+
+    def __str__(self) -> str:
+        parts = [f"[{v!s}]" for v in self]
+        parts.append("None")
+        return " -> ".join(parts)
+
+
+class UnrolledNode:
+    __slots__ = ("values", "next")
+
+    def __init__(self, values: list[Any], next: Optional["UnrolledNode"] = None) -> None:
+        self.values = values
+        self.next = next
+
+    def __repr__(self) -> str:
+        return f"UnrolledNode({self.values!r})"
+
+
+class UnrolledLinkedList:
+    """Развёрнутый (unrolled) связный список: узел хранит блок до capacity значений.
+
+    Один объект-узел на capacity элементов вместо одного на элемент, а обход
+    идёт по плотным list-блокам — меньше памяти и переходов по указателям.
+    Переполненный блок делится пополам, блок меньше capacity // 2
+    сливается со следующим, если вместе они помещаются в capacity.
+
+    Методы (B = capacity):
+      - append(value), prepend(value)  O(1) / O(B)
+      - insert(idx, value)             O(n / B + B)
+      - remove(value)                  O(n) — первое вхождение (ValueError если не найдено)
+      - remove_at(idx)                 O(n / B + B) (IndexError при некорректном индексе)
+      - __getitem__                    O(n / B)
+      - __iter__, __len__, __repr__, __str__
+    """
+
+    __slots__ = ("head", "tail", "_size", "_capacity")
+
+    def __init__(self, iterable=None, capacity: int = 64) -> None:
+        if capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.head: Optional[UnrolledNode] = None
+        self.tail: Optional[UnrolledNode] = None
+        self._size: int = 0
+        self._capacity = capacity
+        if iterable:
+            it = iter(iterable)
+            while True:
+                block = list(islice(it, capacity))
+                if not block:
+                    break
+                self._link_after(self.tail, UnrolledNode(block))
+                self._size += len(block)
+
+    def _link_after(self, prev: Optional[UnrolledNode], node: UnrolledNode) -> None:
+        if prev is None:
+            node.next = self.head
+            self.head = node
+        else:
+            node.next = prev.next
+            prev.next = node
+        if node.next is None:
+            self.tail = node
+
+    def _locate(self, idx: int) -> tuple[Optional[UnrolledNode], UnrolledNode, int]:
+        """(предыдущий узел, узел, смещение в узле) для 0 <= idx < len."""
+        prev: Optional[UnrolledNode] = None
+        node = self.head
+        while node is not None:
+            n = len(node.values)
+            if idx < n:
+                return prev, node, idx
+            idx -= n
+            prev, node = node, node.next
+        raise IndexError("UnrolledLinkedList index out of range")
+
+    def _split(self, node: UnrolledNode) -> None:
+        half = len(node.values) // 2
+        self._link_after(node, UnrolledNode(node.values[half:]))
+        del node.values[half:]
+
+    def _rebalance(self, prev: Optional[UnrolledNode], node: UnrolledNode) -> None:
+        """После удаления: выкинуть пустой узел или слить маленький со следующим."""
+        if not node.values:
+            if prev is None:
+                self.head = node.next
+            else:
+                prev.next = node.next
+            if node is self.tail:
+                self.tail = prev
+            return
+        nxt = node.next
+        if (nxt is not None and len(node.values) < self._capacity // 2
+                and len(node.values) + len(nxt.values) <= self._capacity):
+            node.values.extend(nxt.values)
+            node.next = nxt.next
+            if nxt is self.tail:
+                self.tail = node
+
+    def append(self, value: Any) -> None:
+        """Добавить в конец — O(1)."""
+        tail = self.tail
+        if tail is None or len(tail.values) >= self._capacity:
+            self._link_after(tail, UnrolledNode([value]))
+        else:
+            tail.values.append(value)
+        self._size += 1
+
+    def prepend(self, value: Any) -> None:
+        """Добавить в начало — O(B)."""
+        head = self.head
+        if head is None or len(head.values) >= self._capacity:
+            self._link_after(None, UnrolledNode([value]))
+        else:
+            head.values.insert(0, value)
+        self._size += 1
+
+    def insert(self, idx: int, value: Any) -> None:
+        """Вставить по индексу. Допускаются idx==0 и idx==len."""
+        if idx < 0 or idx > self._size:
+            raise IndexError("insert index out of range")
+        if idx == self._size:
+            self.append(value)
+            return
+        _, node, offset = self._locate(idx)
+        node.values.insert(offset, value)
+        if len(node.values) > self._capacity:
+            self._split(node)
+        self._size += 1
+
+    def remove(self, value: Any) -> None:
+        """Удалить первое вхождение value. Если не найдено — ValueError."""
+        prev: Optional[UnrolledNode] = None
+        node = self.head
+        while node is not None:
+            values = node.values
+            if value in values:
+                del values[values.index(value)]
+                self._size -= 1
+                self._rebalance(prev, node)
+                return
+            prev, node = node, node.next
+        raise ValueError("remove: value not found in UnrolledLinkedList")
+
+    def remove_at(self, idx: int) -> None:
+        """Удалить элемент по индексу. Возбуждает IndexError при неверном индексе."""
+        if idx < 0 or idx >= self._size:
+            raise IndexError("remove_at index out of range")
+        prev, node, offset = self._locate(idx)
+        del node.values[offset]
+        self._size -= 1
+        self._rebalance(prev, node)
+
+    def __getitem__(self, idx: int) -> Any:
+        if idx < 0:
+            idx += self._size
+        if idx < 0 or idx >= self._size:
+            raise IndexError("UnrolledLinkedList index out of range")
+        _, node, offset = self._locate(idx)
+        return node.values[offset]
+
+    def __iter__(self) -> Iterator[Any]:
+        node = self.head
+        while node is not None:
+            yield from node.values
+            node = node.next
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"UnrolledLinkedList([{', '.join(repr(x) for x in self)}])"
+
+    def __str__(self) -> str:
+        parts = []
+        node = self.head
+        while node is not None:
+            parts.append(f"[{', '.join(str(v) for v in node.values)}]")
+            node = node.next
+        parts.append("None")
+        return " -> ".join(parts)
+
+
+if __name__ == "__main__":
+    sll = SinglyLinkedList()
+    print(f'Длина нашего односвязанного списка : {len(sll)}')
+
+    sll.append(1)
+    sll.append(2)
+    sll.prepend(0)
+    print(f'Наша ныняшняя длина списка после добавления эллементов : {len(sll)}') 
+    print(f'Односвязаный список : {list(sll)}')
+
+    sll.insert(1, 0.5)
+    print(f'Длина списка после добавления на 1 индекс числа 0.5 : {len(sll)}')
+    print(f'Односвязаный список : {list(sll)}')
+    sll.append(52)
+    print(f'Односвязанный список после добавления числа в конец : {list(sll)}')
+
+    print(sll)
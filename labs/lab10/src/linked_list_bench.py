@@ -0,0 +1,61 @@
+"""Бенчмарки связных списков.
+
+1. SinglyLinkedList против IndexedLinkedList: для каждого размера n делается
+   OPS вставок insert(i) и OPS удалений remove_at(i) по случайным индексам.
+2. SinglyLinkedList против UnrolledLinkedList: память (tracemalloc)
+   и время полного обхода.
+
+Запуск:
+    python linked_list_bench.py [OPS]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+
+from linked_list import IndexedLinkedList, SinglyLinkedList, UnrolledLinkedList
+
+
+def run(cls, n: int, ops: int, seed: int = 0) -> float:
+    rnd = random.Random(seed)
+    lst = cls(range(n))
+    idx_ins = [rnd.randint(0, n + i) for i in range(ops)]
+    idx_del = [rnd.randrange(n + ops - i) for i in range(ops)]
+    start = time.perf_counter()
+    for i in idx_ins:
+        lst.insert(i, i)
+    for i in idx_del:
+        lst.remove_at(i)
+    return time.perf_counter() - start
+
+
+def main(ops: int = 1000) -> None:
+    print(f"{ops} insert + {ops} remove_at по случайным индексам")
+    print(f"{'n':>10} | {'SinglyLinkedList':>18} | {'IndexedLinkedList':>18}")
+    print("-" * 53)
+    for n in (1_000, 10_000, 100_000):
+        t_sll = run(SinglyLinkedList, n, ops)
+        t_idx = run(IndexedLinkedList, n, ops)
+        print(f"{n:>10} | {t_sll * 1000:15.1f} ms | {t_idx * 1000:15.1f} ms")
+
+
+def memory_and_iteration(n: int = 1_000_000) -> None:
+    print(f"\nn = {n}: память под структуру и время обхода")
+    values = list(range(n))
+    for label, build in (("SinglyLinkedList", lambda: SinglyLinkedList(values)),
+                         ("UnrolledLinkedList(64)", lambda: UnrolledLinkedList(values))):
+        tracemalloc.start()
+        lst = build()
+        mem = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        start = time.perf_counter()
+        for _ in lst:
+            pass
+        elapsed = time.perf_counter() - start
+        print(f"{label:<24} {mem / 2**20:8.1f} MiB | обход {elapsed * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
+    memory_and_iteration()
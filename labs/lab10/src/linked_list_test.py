@@ -0,0 +1,103 @@
+import random
+from linked_list import *
+
+# Случайные операции над IndexedLinkedList и обычным list - результат должен совпадать
+rng = random.Random(42)
+
+
+def check_widths(lst):
+    """Ширина каждой ссылки = разница позиций её концов (None - позиция len)."""
+    pos = {id(lst._head): -1}
+    node, i = lst._head.next[0], 0
+    while node:
+        pos[id(node)] = i
+        node, i = node.next[0], i + 1
+    node = lst._head
+    while node:
+        for lvl in range(min(len(node.next), lst._level)):
+            nxt = node.next[lvl]
+            end = len(lst) if nxt is None else pos[id(nxt)]
+            assert node.width[lvl] == end - pos[id(node)], (node, lvl)
+        node = node.next[0]
+
+
+def random_ops(make, n_ops, check=None):
+    lst, ref = make(), []
+    for step in range(n_ops):
+        op = rng.random()
+        if op < 0.25 or not ref:
+            idx = rng.randint(0, len(ref))
+            lst.insert(idx, step)
+            ref.insert(idx, step)
+        elif op < 0.35:
+            lst.append(step)
+            ref.append(step)
+        elif op < 0.45:
+            lst.prepend(step)
+            ref.insert(0, step)
+        elif op < 0.75:
+            idx = rng.randrange(len(ref))
+            lst.remove_at(idx)
+            del ref[idx]
+        elif op < 0.85:
+            value = rng.choice(ref)
+            lst.remove(value)
+            ref.remove(value)
+        else:
+            idx = rng.randrange(-len(ref), len(ref))
+            assert lst[idx] == ref[idx], (step, idx)
+        assert len(lst) == len(ref)
+        if check is not None and step % 50 == 0:
+            check(lst)
+    if check is not None:
+        check(lst)
+    assert list(lst) == ref
+    return lst, ref
+
+
+print('Testing IndexedLinkedList')
+lst = IndexedLinkedList([0, 1, 2, 3])
+lst.insert(2, 1.5)
+print("[0, 1, 2, 3] insert(2, 1.5) Out:", list(lst), lst[2], lst[-1])
+lst.remove_at(0)
+lst[0] = "a"
+print("remove_at(0), [0] = 'a' Out:", list(lst))
+for bad in (lambda: lst[10], lambda: lst.insert(-1, 0), lambda: lst.remove_at(len(lst)), lambda: lst.remove(99)):
+    try:
+        bad()
+        print("Out: нет ошибки")
+    except (IndexError, ValueError) as e:
+        print(f"Out: {type(e).__name__}: {e}")
+lst, ref = random_ops(IndexedLinkedList, 3000, check_widths)
+print(f"3000 случайных операций Out: совпадает с list, ширины ссылок верны, len={len(lst)}, уровней={lst._level}")
+
+
+def check_blocks(lst):
+    """Блоки не пустые и не больше capacity, tail - последний узел, сумма длин = len."""
+    node, total, last = lst.head, 0, None
+    while node is not None:
+        assert 0 < len(node.values) <= lst._capacity, node
+        total += len(node.values)
+        last, node = node, node.next
+    assert last is lst.tail and total == len(lst)
+
+
+print('\nTesting UnrolledLinkedList')
+lst = UnrolledLinkedList(range(10), capacity=4)
+print("range(10), capacity=4 Out:", lst)
+lst.insert(1, "x")
+lst.insert(1, "y")
+print("insert(1, 'x'), insert(1, 'y') - делится блок Out:", lst)
+lst = UnrolledLinkedList(range(10), capacity=4)
+for _ in range(3):
+    lst.remove_at(4)
+print("range(10), 3 x remove_at(4) - [7] сливается с [8, 9] Out:", lst)
+for bad in (lambda: lst[len(lst)], lambda: lst.remove_at(-1), lambda: lst.remove("z"), lambda: UnrolledLinkedList(capacity=1)):
+    try:
+        bad()
+        print("Out: нет ошибки")
+    except (IndexError, ValueError) as e:
+        print(f"Out: {type(e).__name__}: {e}")
+for capacity in (2, 3, 8, 64):
+    lst, ref = random_ops(lambda: UnrolledLinkedList(capacity=capacity), 3000, check_blocks)
+print("3000 случайных операций, capacity 2/3/8/64 Out: совпадает с list, блоки корректны")
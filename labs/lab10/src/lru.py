@@ -0,0 +1,133 @@
+"""LRUCache — кэш с вытеснением давно не использованных записей.
+
+Построен на DoublyLinkedList из linked_list.py: dict ключ -> узел,
+узлы упорядочены от самого свежего (head) к самому старому (tail).
+Попадание переставляет узел в начало, вытеснение снимает tail — всё O(1).
+
+Пример — мемоизация нормализации текста:
+
+    cache = LRUCache(4096)
+    normalize = cache(normalize)
+"""
+
+from functools import wraps
+from typing import Any, Callable, Hashable
+
+from linked_list import DoublyLinkedList
+
+_MISSING = object()
+# разделитель позиционных и именованных аргументов в ключе memoize (как в functools._make_key)
+_KWMARK = object()
+
+
+class LRUCache:
+    """LRU-кэш на maxsize записей.
+
+    Методы:
+      - get(key, default=None)  O(1), обновляет «свежесть» записи
+      - put(key, value)         O(1), при переполнении выкидывает самую старую
+      - pop(key, default)       O(1)
+      - clear()
+      - __contains__, __len__, __repr__
+      - __call__(func)          декоратор: мемоизация func по аргументам
+
+    Счётчики hits / misses считаются в get и в мемоизированных вызовах.
+    Один экземпляр можно использовать как декоратор для нескольких функций.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_map", "_order")
+
+    def __init__(self, maxsize: int = 128) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._map: dict = {}
+        # значения узлов — пары (key, value)
+        self._order = DoublyLinkedList()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._order.move_to_front(node)
+        return node.value[1]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        node = self._map.get(key)
+        if node is not None:
+            node.value = (key, value)
+            self._order.move_to_front(node)
+            return
+        if len(self._map) >= self.maxsize:
+            old_key, _ = self._order.pop()
+            del self._map[old_key]
+        self._map[key] = self._order.prepend((key, value))
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        node = self._map.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._order.unlink(node)[1]
+
+    def clear(self) -> None:
+        self._map.clear()
+        self._order = DoublyLinkedList()
+        self.hits = self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._map
+
+    def __len__(self) -> int:
+        return len(self._map)
+
+    def __repr__(self) -> str:
+        return (f"LRUCache(maxsize={self.maxsize}, size={len(self)}, "
+                f"hits={self.hits}, misses={self.misses})")
+
+    def __call__(self, func: Callable) -> Callable:
+        """
+        Декоратор: кэширует func(*args, **kwargs) по хешируемым аргументам.
+        Ключ начинается с самой func, поэтому один кэш можно повесить на
+        несколько функций: записи не пересекаются, а maxsize и счётчики общие.
+        """
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (func,) + args
+            if kwargs:
+                key += (_KWMARK,) + tuple(sorted(kwargs.items()))
+            result = self.get(key, _MISSING)
+            if result is _MISSING:
+                result = func(*args, **kwargs)
+                self.put(key, result)
+            return result
+
+        wrapper.cache = self  # type: ignore[attr-defined]
+        return wrapper
+
+
+if __name__ == "__main__":
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+    print(f'После вытеснения : {"a" in cache}, {"b" in cache}, {"c" in cache}')
+
+    @LRUCache(1024)
+    def slow_square(x: int) -> int:
+        return x * x
+
+    for i in (1, 2, 1, 1, 3):
+        slow_square(i)
+    print(f'Мемоизация : {slow_square.cache}')
+
+    shared = LRUCache(8)
+    inc = shared(lambda x: x + 1)
+    hundred = shared(lambda x: x * 100)
+    print(f'Один кэш на две функции : {inc(2)}, {hundred(2)}, {inc(2)}, {hundred(2)} — {shared}')
@@ -1,7 +1,17 @@
-"""Stack и Queue — компактные, эффективные реализации по ТЗ."""
+"""Stack и Queue — компактные, эффективные реализации по ТЗ.
 
+BoundedStack / BoundedQueue / RingBuffer — ограниченные варианты на
+предвыделенном кольцевом буфере с политиками переполнения.
+
+ThreadSafeQueue / AsyncQueue — очереди с ожиданием для потоков и asyncio.
+"""
+
+import asyncio
+import threading
+from array import array
 from collections import deque
-from typing import Any, Optional
+from itertools import repeat, starmap
+from typing import Any, Iterable, Iterator, Optional
 
 
 class Stack:
@@ -10,6 +20,9 @@ class Stack:
     Операции:
       - push(item)      O(1) amortized
       - pop()           O(1)
+      - push_many(items) O(k) — один list.extend
+      - pop_many(n)     O(k) — срез + del, до n элементов сверху
+      - drain()         итератор, снимающий элементы до опустошения
       - peek()          O(1) (возврат None, если пуст)
       - is_empty()      O(1)
       - __len__()       O(1)
@@ -28,6 +41,29 @@ class Stack:
             raise IndexError("pop from empty Stack")
         return self._data.pop()
 
+    def push_many(self, items: Iterable[Any]) -> None:
+        """Положить все items по порядку (последний окажется сверху)."""
+        self._data.extend(items)
+
+    def pop_many(self, n: int) -> list[Any]:
+        """Снять до n элементов сверху. Порядок — как при n вызовах pop()."""
+        if n < 0:
+            raise ValueError("pop_many count must be non-negative")
+        data = self._data
+        k = min(n, len(data))
+        if not k:
+            return []
+        chunk = data[-k:]
+        del data[-k:]
+        chunk.reverse()
+        return chunk
+
+    def drain(self) -> Iterator[Any]:
+        """Снимать элементы сверху, пока стек не опустеет."""
+        data = self._data
+        while data:
+            yield data.pop()
+
     def peek(self) -> Optional[Any]:
         return self._data[-1] if self._data else None
 
@@ -47,6 +83,9 @@ class Queue:
     Операции:
       - enqueue(item)   O(1)
       - dequeue()       O(1)
+      - enqueue_many(items) O(k) — один deque.extend
+      - dequeue_many(n) O(k) — до n элементов с головы, без вызовов dequeue
+      - drain()         итератор, забирающий элементы до опустошения
       - peek()          O(1) (возврат None, если пуст)
       - is_empty()      O(1)
       - __len__()       O(1)
@@ -65,6 +104,28 @@ class Queue:
             raise IndexError("dequeue from empty Queue")
         return self._data.popleft()
 
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        """Поставить все items в хвост по порядку."""
+        self._data.extend(items)
+
+    def dequeue_many(self, n: int) -> list[Any]:
+        """Забрать до n элементов с головы в порядке очереди."""
+        if n < 0:
+            raise ValueError("dequeue_many count must be non-negative")
+        data = self._data
+        if n >= len(data):
+            out = list(data)
+            data.clear()
+            return out
+        # deque не умеет срезы: n вызовов popleft, но из C (starmap), без байткода на элемент
+        return list(starmap(data.popleft, repeat((), n)))
+
+    def drain(self) -> Iterator[Any]:
+        """Забирать элементы с головы, пока очередь не опустеет."""
+        data = self._data
+        while data:
+            yield data.popleft()
+
     def peek(self) -> Optional[Any]:
         return self._data[0] if self._data else None
 
@@ -77,25 +138,402 @@ class Queue:
     def __repr__(self) -> str:
         return f"Queue({list(self._data)!r})"
 
-print('Stack')
 
-stack = Stack([1,2,3,4])
-print(f'Снятие верхнего элемента стека : {stack.pop()}')
-print(f'Пустой ли стек? {stack.is_empty()}')
-print(f'Число сверху : {stack.peek()}')
-stack.push(1)
-print(f'Значение сверху после добавления числа в стек : {stack.peek()}')
-print(f'Длина стека : {len(stack)}')
-print(f'Стек : {stack._data}')
+class ThreadSafeQueue(Queue):
+    """Потокобезопасная очередь (FIFO) поверх Queue.
+
+    Все операции идут под одним threading.Lock; ожидание — через две
+    threading.Condition (not_empty / not_full) на этом замке.
+
+    Операции:
+      - put(item, block=True, timeout=None)  O(1); при maxsize > 0 ждёт место,
+        без блокировки на полной очереди — OverflowError, по таймауту — TimeoutError
+      - get(block=True, timeout=None)        O(1); ждёт элемент, без блокировки
+        на пустой очереди — IndexError (как dequeue), по таймауту — TimeoutError
+      - enqueue(item) / dequeue()            неблокирующие put / get
+      - enqueue_many(items) / dequeue_many(n) — пачкой под одним захватом замка;
+        если пачка не влезает в maxsize — OverflowError, ничего не добавляется
+      - drain()                              итератор неблокирующих get
+      - peek(), is_empty(), __len__()
+    Начальные данные длиннее maxsize — OverflowError.
+    """
+
+    __slots__ = ("_maxsize", "_lock", "_not_empty", "_not_full")
+
+    def __init__(self, iterable=None, maxsize: int = 0) -> None:
+        super().__init__(iterable)
+        if 0 < maxsize < len(self._data):
+            raise OverflowError("initial data exceeds ThreadSafeQueue maxsize")
+        self._maxsize = maxsize
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+
+    def _is_full(self) -> bool:
+        return 0 < self._maxsize <= len(self._data)
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        with self._not_full:
+            if self._is_full():
+                if not block:
+                    raise OverflowError("put to full ThreadSafeQueue")
+                if not self._not_full.wait_for(lambda: not self._is_full(), timeout):
+                    raise TimeoutError("put to full ThreadSafeQueue timed out")
+            self._data.append(item)
+            self._not_empty.notify()
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        with self._not_empty:
+            if not self._data:
+                if not block:
+                    raise IndexError("dequeue from empty Queue")
+                if not self._not_empty.wait_for(lambda: self._data, timeout):
+                    raise TimeoutError("get from empty ThreadSafeQueue timed out")
+            item = self._data.popleft()
+            self._not_full.notify()
+            return item
+
+    def enqueue(self, item: Any) -> None:
+        self.put(item, block=False)
+
+    def dequeue(self) -> Any:
+        return self.get(block=False)
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        with self._lock:
+            if self._maxsize > 0 and len(self._data) + len(items) > self._maxsize:
+                raise OverflowError("enqueue_many to full ThreadSafeQueue")
+            self._data.extend(items)
+            self._not_empty.notify(len(items))
+
+    def dequeue_many(self, n: int) -> list[Any]:
+        with self._lock:
+            out = Queue.dequeue_many(self, n)
+            self._not_full.notify(len(out))
+            return out
+
+    def drain(self) -> Iterator[Any]:
+        # замок берётся на каждый элемент, а не на всю итерацию
+        while True:
+            try:
+                yield self.get(block=False)
+            except IndexError:
+                return
+
+    def peek(self) -> Optional[Any]:
+        with self._lock:
+            return self._data[0] if self._data else None
+
+    def __repr__(self) -> str:
+        with self._lock:
+            return f"ThreadSafeQueue({list(self._data)!r}, maxsize={self._maxsize})"
+
+
+class AsyncQueue(Queue):
+    """Очередь (FIFO) для asyncio поверх Queue, с обратным давлением.
+
+    Ждущие корутины паркуются на future в очередях _getters / _putters
+    (как в asyncio.Queue), enqueue/dequeue будят по одной.
+
+    Операции:
+      - await put(item, timeout=None)  ждёт место при maxsize > 0, таймаут → TimeoutError
+      - await get(timeout=None)        ждёт элемент, таймаут → TimeoutError
+      - enqueue(item)                  без ожидания; на полной очереди — OverflowError
+      - dequeue()                      без ожидания; на пустой — IndexError
+      - enqueue_many(items) / dequeue_many(n) / drain() — пачкой, без ожидания
+      - is_full(), peek(), is_empty(), __len__()
+    Начальные данные длиннее maxsize — OverflowError.
+    """
+
+    __slots__ = ("_maxsize", "_getters", "_putters")
+
+    def __init__(self, iterable=None, maxsize: int = 0) -> None:
+        super().__init__(iterable)
+        if 0 < maxsize < len(self._data):
+            raise OverflowError("initial data exceeds AsyncQueue maxsize")
+        self._maxsize = maxsize
+        self._getters: deque[asyncio.Future] = deque()
+        self._putters: deque[asyncio.Future] = deque()
+
+    @staticmethod
+    def _wakeup_next(waiters: deque) -> None:
+        while waiters:
+            fut = waiters.popleft()
+            if not fut.done():
+                fut.set_result(None)
+                break
+
+    def is_full(self) -> bool:
+        return 0 < self._maxsize <= len(self._data)
+
+    def enqueue(self, item: Any) -> None:
+        if self.is_full():
+            raise OverflowError("enqueue to full AsyncQueue")
+        self._data.append(item)
+        self._wakeup_next(self._getters)
+
+    def dequeue(self) -> Any:
+        item = super().dequeue()
+        self._wakeup_next(self._putters)
+        return item
+
+    def enqueue_many(self, items: Iterable[Any]) -> None:
+        items = list(items)
+        if self._maxsize > 0 and len(self._data) + len(items) > self._maxsize:
+            raise OverflowError("enqueue_many to full AsyncQueue")
+        self._data.extend(items)
+        for _ in items:
+            if not self._getters:
+                break
+            self._wakeup_next(self._getters)
+
+    def dequeue_many(self, n: int) -> list[Any]:
+        out = super().dequeue_many(n)
+        for _ in out:
+            if not self._putters:
+                break
+            self._wakeup_next(self._putters)
+        return out
+
+    def drain(self) -> Iterator[Any]:
+        while self._data:
+            yield self.dequeue()
+
+    async def _wait(self, waiters: deque, blocked) -> None:
+        loop = asyncio.get_running_loop()
+        while blocked():
+            fut = loop.create_future()
+            waiters.append(fut)
+            try:
+                await fut
+            except BaseException:
+                fut.cancel()
+                try:
+                    waiters.remove(fut)
+                except ValueError:
+                    pass
+                # нас уже разбудили, но мы уходим — передаём очередь следующему
+                if not blocked():
+                    self._wakeup_next(waiters)
+                raise
+
+    # Ожидание и enqueue/dequeue идут в одной задаче без await между ними:
+    # _wait перепроверяет условие после каждого пробуждения, и никто не успеет
+    # забрать элемент или место (wait_for запускал бы _wait отдельной задачей).
+    async def put(self, item: Any, timeout: Optional[float] = None) -> None:
+        if self.is_full():
+            async with asyncio.timeout(timeout):
+                await self._wait(self._putters, self.is_full)
+        self.enqueue(item)
+
+    async def get(self, timeout: Optional[float] = None) -> Any:
+        if not self._data:
+            async with asyncio.timeout(timeout):
+                await self._wait(self._getters, self.is_empty)
+        return self.dequeue()
+
+    def __repr__(self) -> str:
+        return f"AsyncQueue({list(self._data)!r}, maxsize={self._maxsize})"
+
+
+# Политики переполнения для ограниченных структур
+DROP_OLDEST = "drop_oldest"  # затереть самый старый элемент
+REJECT = "reject"            # OverflowError
+BLOCK = "block"              # ждать, пока освободится место (для потоков)
+_POLICIES = (DROP_OLDEST, REJECT, BLOCK)
+
+
+class RingBuffer:
+    """Кольцевой буфер фиксированной ёмкости.
+
+    Хранилище выделяется один раз в __init__: list на maxlen ячеек или,
+    если задан typecode, array(typecode) — компактно для чисел.
+    Дальше никаких реаллокаций, только сдвиг индексов по модулю maxlen.
+
+    Операции:
+      - append(item, timeout=None)  O(1), при переполнении — по политике overflow
+      - pop()                       O(1) — с конца (новейший)
+      - popleft()                   O(1) — с начала (старейший)
+      - peek() / peekleft()         O(1) (возврат None, если пуст)
+      - is_empty(), is_full()       O(1)
+      - __len__(), __iter__()
+
+    При overflow=BLOCK все операции идут под threading.Condition, append ждёт
+    освобождения места не дольше timeout секунд (None — без ограничения),
+    по истечении — TimeoutError (как ThreadSafeQueue.put).
+    Начальные данные конструкторов BoundedStack/BoundedQueue, не влезающие
+    в maxlen, при REJECT и BLOCK дают OverflowError — ждать их некому.
+    """
+
+    __slots__ = ("_buf", "_maxlen", "_head", "_size", "_overflow", "_blank", "_cond")
+
+    def __init__(self, maxlen: int, typecode: Optional[str] = None, overflow: str = DROP_OLDEST) -> None:
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        if overflow not in _POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow!r}")
+        if typecode is None:
+            self._buf: Any = [None] * maxlen
+            self._blank: Any = None
+        else:
+            self._buf = array(typecode)
+            self._buf.frombytes(bytes(self._buf.itemsize * maxlen))
+            self._blank = self._buf[0]
+        self._maxlen = maxlen
+        self._head = 0
+        self._size = 0
+        self._overflow = overflow
+        self._cond = threading.Condition() if overflow == BLOCK else None
+
+    @property
+    def maxlen(self) -> int:
+        return self._maxlen
+
+    def _append(self, item: Any) -> None:
+        if self._size == self._maxlen:
+            if self._overflow != DROP_OLDEST:
+                raise OverflowError(f"{type(self).__name__} is full")
+            # DROP_OLDEST: пишем на место головы и сдвигаем её
+            self._buf[self._head] = item
+            self._head = (self._head + 1) % self._maxlen
+            return
+        self._buf[(self._head + self._size) % self._maxlen] = item
+        self._size += 1
+
+    def _pop(self) -> Any:
+        if not self._size:
+            raise IndexError(f"pop from empty {type(self).__name__}")
+        self._size -= 1
+        idx = (self._head + self._size) % self._maxlen
+        item = self._buf[idx]
+        self._buf[idx] = self._blank
+        return item
+
+    def _popleft(self) -> Any:
+        if not self._size:
+            raise IndexError(f"pop from empty {type(self).__name__}")
+        idx = self._head
+        item = self._buf[idx]
+        self._buf[idx] = self._blank
+        self._head = (idx + 1) % self._maxlen
+        self._size -= 1
+        return item
+
+    def append(self, item: Any, timeout: Optional[float] = None) -> None:
+        cond = self._cond
+        if cond is None:
+            self._append(item)
+            return
+        with cond:
+            if not cond.wait_for(lambda: self._size < self._maxlen, timeout):
+                raise TimeoutError(f"append to full {type(self).__name__} timed out")
+            self._append(item)
+
+    def pop(self) -> Any:
+        cond = self._cond
+        if cond is None:
+            return self._pop()
+        with cond:
+            item = self._pop()
+            cond.notify()
+            return item
+
+    def popleft(self) -> Any:
+        cond = self._cond
+        if cond is None:
+            return self._popleft()
+        with cond:
+            item = self._popleft()
+            cond.notify()
+            return item
+
+    def peek(self) -> Optional[Any]:
+        if not self._size:
+            return None
+        return self._buf[(self._head + self._size - 1) % self._maxlen]
+
+    def peekleft(self) -> Optional[Any]:
+        return self._buf[self._head] if self._size else None
+
+    def is_empty(self) -> bool:
+        return not self._size
+
+    def is_full(self) -> bool:
+        return self._size == self._maxlen
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        buf, maxlen, head = self._buf, self._maxlen, self._head
+        for i in range(self._size):
+            yield buf[(head + i) % maxlen]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self)!r}, maxlen={self._maxlen})"
+
+
+class BoundedStack(RingBuffer):
+    """Ограниченный стек (LIFO) поверх RingBuffer.
+
+    API как у Stack (push/pop/peek/is_empty/__len__) плюс is_full().
+    При переполнении по умолчанию REJECT; DROP_OLDEST выкидывает дно стека.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, maxlen: int, iterable=None, typecode: Optional[str] = None,
+                 overflow: str = REJECT) -> None:
+        super().__init__(maxlen, typecode, overflow)
+        if iterable is not None:
+            for item in iterable:
+                self._append(item)
+
+    push = RingBuffer.append
+
+
+class BoundedQueue(RingBuffer):
+    """Ограниченная очередь (FIFO) поверх RingBuffer.
+
+    API как у Queue (enqueue/dequeue/peek/is_empty/__len__) плюс is_full().
+    При переполнении по умолчанию REJECT; DROP_OLDEST выкидывает голову очереди.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, maxlen: int, iterable=None, typecode: Optional[str] = None,
+                 overflow: str = REJECT) -> None:
+        super().__init__(maxlen, typecode, overflow)
+        if iterable is not None:
+            for item in iterable:
+                self._append(item)
+
+    enqueue = RingBuffer.append
+    dequeue = RingBuffer.popleft
+    peek = RingBuffer.peekleft
+
+
+if __name__ == "__main__":
+    print('Stack')
+
+    stack = Stack([1,2,3,4])
+    print(f'Снятие верхнего элемента стека : {stack.pop()}')
+    print(f'Пустой ли стек? {stack.is_empty()}')
+    print(f'Число сверху : {stack.peek()}')
+    stack.push(1)
+    print(f'Значение сверху после добавления числа в стек : {stack.peek()}')
+    print(f'Длина стека : {len(stack)}')
+    print(f'Стек : {stack._data}')
 
-print('Deque')
+    print('Deque')
 
-q = Queue([1,2,3,4])
+    q = Queue([1,2,3,4])
 
-print(f'Значение первого эллемента : {q.peek()}')
-q.dequeue()
-print(f'Значение первого эллемента после удаления числа : {q.peek()}')
-q.enqueue(52)
-print(f'Значение первого эллемента после добавления числа : {q.peek()}')
-print(f'Пустая ли очередь? {q.is_empty()}')
-print(f'Количество элементов в очереди : {len(q)}')
\ No newline at end of file
+    print(f'Значение первого эллемента : {q.peek()}')
+    q.dequeue()
+    print(f'Значение первого эллемента после удаления числа : {q.peek()}')
+    q.enqueue(52)
+    print(f'Значение первого эллемента после добавления числа : {q.peek()}')
+    print(f'Пустая ли очередь? {q.is_empty()}')
+    print(f'Количество элементов в очереди : {len(q)}')
\ No newline at end of file
@@ -0,0 +1,155 @@
+"""Бенчмарк: Stack/Queue против BoundedStack/BoundedQueue/RingBuffer,
+пропускная способность ThreadSafeQueue/AsyncQueue при нескольких
+производителях и потребителях (MPMC) против queue.Queue/asyncio.Queue.
+
+Запуск:
+    python structures_bench.py [N]
+"""
+
+import asyncio
+import queue
+import sys
+import threading
+import time
+import timeit
+
+from structures import (AsyncQueue, BoundedQueue, BoundedStack, DROP_OLDEST, Queue,
+                        RingBuffer, Stack, ThreadSafeQueue)
+
+
+def bench(label: str, func, number: int = 5) -> None:
+    best = min(timeit.repeat(func, number=1, repeat=number))
+    print(f"{label:<40} {best * 1000:8.2f} ms")
+
+
+def main(n: int = 200_000) -> None:
+    maxlen = 1024
+    print(f"N = {n}, maxlen = {maxlen}")
+
+    print("\nStack: push + pop пачками по maxlen")
+
+    def run_stack(s):
+        push, pop = s.push, s.pop
+        for _ in range(n // maxlen):
+            for i in range(maxlen):
+                push(i)
+            for _ in range(maxlen):
+                pop()
+
+    bench("Stack (list)", lambda: run_stack(Stack()))
+    bench("BoundedStack (list)", lambda: run_stack(BoundedStack(maxlen)))
+    bench("BoundedStack (array 'd')", lambda: run_stack(BoundedStack(maxlen, typecode="d")))
+
+    print("\nQueue: enqueue + dequeue пачками по maxlen")
+
+    def run_queue(q):
+        enqueue, dequeue = q.enqueue, q.dequeue
+        for _ in range(n // maxlen):
+            for i in range(maxlen):
+                enqueue(i)
+            for _ in range(maxlen):
+                dequeue()
+
+    bench("Queue (deque)", lambda: run_queue(Queue()))
+    bench("BoundedQueue (list)", lambda: run_queue(BoundedQueue(maxlen)))
+    bench("BoundedQueue (array 'd')", lambda: run_queue(BoundedQueue(maxlen, typecode="d")))
+
+    print("\nСкользящее окно: append с вытеснением старых")
+
+    def run_window(r):
+        append = r.append
+        for i in range(n):
+            append(float(i))
+
+    bench("RingBuffer DROP_OLDEST (list)", lambda: run_window(RingBuffer(maxlen)))
+    bench("RingBuffer DROP_OLDEST (array 'd')", lambda: run_window(RingBuffer(maxlen, "d", DROP_OLDEST)))
+
+    print("\nПачки: по одному элементу против *_many")
+    items = list(range(maxlen))
+
+    def per_item(put, take):
+        for _ in range(n // maxlen):
+            for x in items:
+                put(x)
+            for _ in range(maxlen):
+                take()
+
+    def batched(put_many, take_many):
+        for _ in range(n // maxlen):
+            put_many(items)
+            take_many(maxlen)
+
+    st, qu = Stack(), Queue()
+    bench("Stack push/pop", lambda: per_item(st.push, st.pop))
+    bench("Stack push_many/pop_many", lambda: batched(st.push_many, st.pop_many))
+    bench("Queue enqueue/dequeue", lambda: per_item(qu.enqueue, qu.dequeue))
+    bench("Queue enqueue_many/dequeue_many", lambda: batched(qu.enqueue_many, qu.dequeue_many))
+
+    print("\nПамять на maxlen элементов (только контейнер)")
+    full_q = Queue(float(i) for i in range(maxlen))
+    ring = RingBuffer(maxlen, "d")
+    print(f"{'Queue (deque)':<40} {sys.getsizeof(full_q._data):8} B + {maxlen} float-объектов")
+    print(f"{'RingBuffer (array d)':<40} {sys.getsizeof(ring._buf):8} B")
+
+
+def mpmc_threads(put, get, n: int, producers: int, consumers: int) -> float:
+    """n элементов через очередь: producers потоков пишут, consumers читают."""
+    def produce(count):
+        for i in range(count):
+            put(i)
+
+    def consume():
+        while get() is not None:
+            pass
+
+    workers = [threading.Thread(target=consume) for _ in range(consumers)]
+    workers += [threading.Thread(target=produce, args=(n // producers,)) for _ in range(producers)]
+    start = time.perf_counter()
+    for t in workers:
+        t.start()
+    for t in workers[consumers:]:
+        t.join()
+    for _ in range(consumers):
+        put(None)
+    for t in workers[:consumers]:
+        t.join()
+    return time.perf_counter() - start
+
+
+async def mpmc_async(q, n: int, producers: int, consumers: int) -> float:
+    async def produce(count):
+        for i in range(count):
+            await q.put(i)
+
+    async def consume():
+        while await q.get() is not None:
+            pass
+
+    start = time.perf_counter()
+    readers = [asyncio.create_task(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce(n // producers) for _ in range(producers)))
+    for _ in range(consumers):
+        await q.put(None)
+    await asyncio.gather(*readers)
+    return time.perf_counter() - start
+
+
+def main_mpmc(n: int = 200_000) -> None:
+    print(f"\nMPMC, N = {n}, maxsize = 1024 (элементов/с)")
+    for p, c in ((1, 1), (4, 4)):
+        tsq = ThreadSafeQueue(maxsize=1024)
+        std = queue.Queue(maxsize=1024)
+        t1 = mpmc_threads(tsq.put, tsq.get, n, p, c)
+        t2 = mpmc_threads(std.put, std.get, n, p, c)
+        print(f"{f'ThreadSafeQueue {p}P/{c}C':<40} {n / t1:12,.0f}")
+        print(f"{f'queue.Queue {p}P/{c}C':<40} {n / t2:12,.0f}")
+        t3 = asyncio.run(mpmc_async(AsyncQueue(maxsize=1024), n, p, c))
+        t4 = asyncio.run(mpmc_async(asyncio.Queue(maxsize=1024), n, p, c))
+        print(f"{f'AsyncQueue {p}P/{c}C':<40} {n / t3:12,.0f}")
+        print(f"{f'asyncio.Queue {p}P/{c}C':<40} {n / t4:12,.0f}")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    main(n)
+    main_mpmc(n)
@@ -0,0 +1,157 @@
+import asyncio
+import threading
+import time
+from structures import *
+
+# Конкурентные проверки ThreadSafeQueue и AsyncQueue
+
+
+def error_of(func):
+    try:
+        func()
+    except (IndexError, OverflowError, TimeoutError) as e:
+        return f"{type(e).__name__}: {e}"
+    return "нет ошибки"
+
+
+print('Testing ThreadSafeQueue')
+print("ThreadSafeQueue([1, 2, 3], maxsize=2) Out:", error_of(lambda: ThreadSafeQueue([1, 2, 3], maxsize=2)))
+q = ThreadSafeQueue([1, 2], maxsize=2)
+print("put(3, block=False) в полную Out:", error_of(lambda: q.put(3, block=False)))
+start = time.perf_counter()
+print("put(3, timeout=0.05) в полную Out:", error_of(lambda: q.put(3, timeout=0.05)),
+      f"через {time.perf_counter() - start:.2f} с")
+print("get(timeout=0.05) из пустой Out:", error_of(lambda: ThreadSafeQueue().get(timeout=0.05)))
+
+# 4 производителя и 4 потребителя через очередь на 8 мест: каждый элемент
+# доходит ровно один раз, размер очереди не превышает maxsize
+q = ThreadSafeQueue(maxsize=8)
+producers, consumers, per_producer = 4, 4, 5000
+got = [[] for _ in range(consumers)]
+peak = [0]
+
+
+def produce(base):
+    for i in range(per_producer):
+        q.put(base + i, timeout=5)
+        peak[0] = max(peak[0], len(q))
+
+
+def consume(out):
+    while True:
+        item = q.get(timeout=5)
+        if item is None:
+            return
+        out.append(item)
+
+
+threads = [threading.Thread(target=produce, args=(p * per_producer,)) for p in range(producers)]
+threads += [threading.Thread(target=consume, args=(got[c],)) for c in range(consumers)]
+for t in threads:
+    t.start()
+for t in threads[:producers]:
+    t.join()
+for _ in range(consumers):
+    q.put(None, timeout=5)
+for t in threads[producers:]:
+    t.join()
+items = sorted(x for out in got for x in out)
+assert items == list(range(producers * per_producer)), "потеряны или продублированы элементы"
+assert peak[0] <= 8
+print(f"{producers} производителя x {per_producer}, {consumers} потребителя, maxsize=8 Out: "
+      f"все {len(items)} элементов ровно по разу, максимум в очереди {peak[0]}")
+
+# enqueue_many / dequeue_many под нагрузкой из нескольких потоков
+q = ThreadSafeQueue()
+threads = [threading.Thread(target=lambda b=b: q.enqueue_many(range(b, b + 1000))) for b in range(0, 8000, 1000)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+batches = []
+threads = [threading.Thread(target=lambda: batches.append(q.dequeue_many(1000))) for _ in range(8)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+assert sorted(x for b in batches for x in b) == list(range(8000)) and q.is_empty()
+print("8 потоков enqueue_many + 8 потоков dequeue_many Out: 8000 элементов, очередь пуста")
+
+
+print('\nTesting AsyncQueue')
+print("AsyncQueue([1, 2, 3], maxsize=2) Out:", error_of(lambda: AsyncQueue([1, 2, 3], maxsize=2)))
+
+
+async def check_async():
+    # get с таймаутом не должен упасть, если рядом есть неблокирующий dequeue
+    q = AsyncQueue()
+    waiter = asyncio.create_task(q.get(timeout=1))
+    await asyncio.sleep(0.01)
+    q.enqueue(1)
+    try:
+        stolen = q.dequeue()
+    except IndexError:
+        stolen = None
+    if stolen is not None:
+        q.enqueue(2)
+    print("get(timeout=1) и соседний dequeue Out:", await waiter, "| dequeue:", stolen)
+
+    # put с таймаутом при гонке за освободившееся место
+    q = AsyncQueue([0], maxsize=1)
+    putter = asyncio.create_task(q.put("p", timeout=1))
+    await asyncio.sleep(0.01)
+    q.dequeue()
+    await asyncio.sleep(0)
+    thief = error_of(lambda: q.enqueue("thief"))
+    await putter
+    print("put(timeout=1) и соседний enqueue Out:", list(q.drain()), "| enqueue:", thief)
+
+    q = AsyncQueue([0], maxsize=1)
+    try:
+        await q.put(1, timeout=0.05)
+    except TimeoutError:
+        print("put(timeout=0.05) в полную Out: TimeoutError, в очереди", list(q.drain()))
+    try:
+        await AsyncQueue().get(timeout=0.05)
+    except TimeoutError:
+        print("get(timeout=0.05) из пустой Out: TimeoutError")
+
+    # производители и потребители с таймаутами и maxsize=4
+    q = AsyncQueue(maxsize=4)
+    n_prod, n_cons, per = 8, 8, 500
+    peak = 0
+
+    async def produce(base):
+        nonlocal peak
+        for i in range(per):
+            await q.put(base + i, timeout=5)
+            peak = max(peak, len(q))
+            if i % 7 == 0:
+                await asyncio.sleep(0)
+
+    async def consume():
+        out = []
+        while (item := await q.get(timeout=5)) is not None:
+            out.append(item)
+        return out
+
+    cons = [asyncio.create_task(consume()) for _ in range(n_cons)]
+    await asyncio.gather(*(produce(p * per) for p in range(n_prod)))
+    for _ in range(n_cons):
+        await q.put(None, timeout=5)
+    items = sorted(x for out in await asyncio.gather(*cons) for x in out)
+    assert items == list(range(n_prod * per)), "потеряны или продублированы элементы"
+    assert peak <= 4
+    print(f"{n_prod} производителей, {n_cons} потребителей, maxsize=4 Out: "
+          f"все {len(items)} элементов ровно по разу, максимум в очереди {peak}")
+
+    # отменённый по таймауту get не съедает пробуждение: элемент достаётся следующему
+    q = AsyncQueue()
+    slow = asyncio.create_task(q.get(timeout=0.01))
+    fast = asyncio.create_task(q.get())
+    await asyncio.sleep(0.05)
+    q.enqueue("x")
+    print("get после чужого таймаута Out:", await fast, "|", error_of(slow.result) if slow.done() else "")
+
+
+asyncio.run(check_async())
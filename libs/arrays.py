@@ -1,14 +1,120 @@
-def min_max(nums: list[float | int]) -> tuple[float | int, float | int] | type[ValueError]:
-    return (min(nums), max(nums)) if (len(nums) != 0) else ValueError
+from array import array
+from itertools import chain, islice
+from typing import Iterable, Iterator
 
-def unique_sorted(nums: list[float | int]) -> list[float | int]:    
-    return sorted(list(set(nums)))
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен — без него всё считается на чистом Python
+    np = None
+
+# ndarray, array.array и прочие объекты с буферным протоколом считаются в numpy
+# без перевода в список; ответ — те же питоновские типы (.item() / .tolist())
+
+def _np_array(nums):
+    if np is None or isinstance(nums, (list, tuple, range, str)):
+        return None
+    if isinstance(nums, np.ndarray):
+        arr = nums
+    else:
+        try:
+            arr = np.asarray(memoryview(nums))
+        except (TypeError, ValueError):
+            return None
+    # строки, array('u') и object-массивы считаются по-старому
+    return arr if arr.dtype.kind in "biuf" else None
+
+# Для последовательностей min() и max() — два прохода, но оба целиком в C,
+# это быстрее одного прохода циклом на Python. Итератор второй раз не пройти,
+# поэтому он читается кусками по chunk_size, и min/max считаются по каждому куску.
+
+def min_max(nums: Iterable[float | int], chunk_size: int = 4096) -> tuple[float | int, float | int] | type[ValueError]:
+    arr = _np_array(nums)
+    if arr is not None:
+        return (arr.min().item(), arr.max().item()) if arr.size != 0 else ValueError
+    if hasattr(nums, "__len__") and hasattr(nums, "__getitem__"):
+        return (min(nums), max(nums)) if (len(nums) != 0) else ValueError
+    return min_max_chunks(chunks(nums, chunk_size))
+
+def min_max_chunks(parts: Iterable[Iterable[float | int]]) -> tuple[float | int, float | int] | type[ValueError]:
+    """min/max по потоку кусков (списки, array, ...); пустые куски пропускаются"""
+    lo = hi = None
+    for part in parts:
+        if len(part) == 0: continue
+        p_lo, p_hi = min(part), max(part)
+        if lo is None:
+            lo, hi = p_lo, p_hi
+            continue
+        if p_lo < lo: lo = p_lo
+        if p_hi > hi: hi = p_hi
+    return ValueError if lo is None else (lo, hi)
+
+def chunks(nums: Iterable[float | int], size: int = 4096, typecode: str | None = None) -> Iterator[list | array]:
+    """
+    Режет поток на куски по size элементов (последний может быть короче).
+    typecode ('d', 'q', ...) — куски отдаются как array: в 4-8 раз меньше памяти,
+    чем список чисел-объектов.
+    """
+    if size <= 0:
+        raise ValueError("size должен быть > 0")
+    it = iter(nums)
+    make = list if typecode is None else (lambda part: array(typecode, part))
+    while part := make(islice(it, size)):
+        yield part
+
+# set() и sorted() по набору уникальных целиком в C: для int Timsort на
+# множестве почти линейный (порядок в set близок к порядку значений).
+# Битовая карта и поразрядная сортировка на чистом Python проигрывают
+# ему на всех размерах (см. arrays_bench.py), поэтому их тут нет.
+# В numpy карта векторизуется и для целых из узкого диапазона
+# (hi - lo до 8 * n) вдвое быстрее сортировки.
+
+def _np_unique(arr) -> list[float | int]:
+    arr = arr.ravel()
+    if arr.dtype.kind in "iu" and arr.size != 0:
+        lo, hi = int(arr.min()), int(arr.max())
+        if hi - lo <= 8 * arr.size + 65536:
+            bitmap = np.zeros(hi - lo + 1, dtype=bool)
+            # разность для знаковых может переполнить тип, но как беззнаковое
+            # число того же размера она точна: 0 <= x - lo < 2**bits
+            offsets = arr - arr.dtype.type(lo)
+            bitmap[offsets.view(offsets.dtype.str.replace("i", "u"))] = True
+            return (np.flatnonzero(bitmap).astype(arr.dtype) + arr.dtype.type(lo)).tolist()
+    # np.unique для целых в numpy 2.x идёт через хеш-таблицу и медленнее
+    # сортировки с отбором соседних различных
+    arr = np.sort(arr)
+    if arr.size == 0:
+        return []
+    keep = np.empty(arr.size, dtype=bool)
+    keep[0] = True
+    np.not_equal(arr[1:], arr[:-1], out=keep[1:])
+    return arr[keep].tolist()
+
+def unique_sorted(nums: Iterable[float | int]) -> list[float | int]:
+    arr = _np_array(nums)
+    if arr is not None:
+        return _np_unique(arr)
+    return sorted(set(nums))
+
+def _check_item(obj):
+    if not isinstance(obj, (list, tuple)):
+        raise TypeError("flatten ожидает список списков/кортежей")
+    return obj
+
+def iflatten(mat: Iterable[list | tuple]) -> Iterator:
+    """Ленивый flatten: элементы отдаются по одному, при чужом элементе — TypeError"""
+    return chain.from_iterable(map(_check_item, mat))
 
 def flatten(mat: list[list | tuple]) -> list | type[TypeError]:
-    output = []
+    arr = _np_array(mat)
+    if arr is not None:
+        # как и для списков, раскрывается один уровень вложенности
+        if arr.ndim < 2: return TypeError
+        return arr.reshape(-1, *arr.shape[2:]).tolist()
     for obj in mat:
-        if not isinstance(obj, tuple) and not isinstance(obj, list):
+        if not isinstance(obj, (list, tuple)):
             return TypeError
-        for val in obj:
-            output.append(val)
-    return output
\ No newline at end of file
+    return list(chain.from_iterable(mat))
+
+def flatten_chunks(mat: Iterable[list | tuple], size: int = 4096, typecode: str | None = None) -> Iterator[list | array]:
+    """iflatten, нарезанный на куски по size (см. chunks)"""
+    return chunks(iflatten(mat), size, typecode)
@@ -0,0 +1,128 @@
+"""Бенчмарк arrays.py: старые min_max / flatten против новых
+(однопроходный min_max по генератору, flatten на chain, ленивый iflatten)
+и память при обработке потока кусками. В конце — unique_sorted против
+битовой карты и поразрядной сортировки на чистом Python и путь через numpy
+для array('q').
+
+Запуск:
+    python arrays_bench.py [N]   # по умолчанию 1_000_000 элементов
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from itertools import compress, repeat
+from operator import sub
+
+import arrays
+
+
+def legacy_min_max(nums):
+    return (min(nums), max(nums)) if (len(nums) != 0) else ValueError
+
+
+def legacy_flatten(mat):
+    output = []
+    for obj in mat:
+        if not isinstance(obj, tuple) and not isinstance(obj, list):
+            return TypeError
+        for val in obj:
+            output.append(val)
+    return output
+
+
+def legacy_unique_sorted(nums):
+    return sorted(list(set(nums)))
+
+
+def bitmap_unique_sorted(nums):
+    """Кандидат для узкого диапазона int: bytearray-карта на hi - lo + 1 байт"""
+    s = set(nums)
+    lo, hi = min(s), max(s)
+    bitmap = bytearray(hi - lo + 1)
+    deque(map(bitmap.__setitem__, map(sub, s, repeat(lo)), repeat(1)), maxlen=0)
+    return list(compress(range(lo, hi + 1), bitmap))
+
+
+def radix_unique_sorted(nums):
+    """Кандидат для больших int >= 0: LSD-сортировка по байтам"""
+    out = list(set(nums))
+    width = max(out).bit_length() if out else 0
+    for shift in range(0, width, 8):
+        buckets = [[] for _ in range(256)]
+        for x in out:
+            buckets[(x >> shift) & 255].append(x)
+        out = [x for bucket in buckets for x in bucket]
+    return out
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def peak(func, *args) -> float:
+    tracemalloc.start()
+    func(*args)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size / 2**20
+
+
+def main(n: int = 1_000_000) -> None:
+    nums = [random.random() for _ in range(n)]
+    mat = [nums[i:i + 10] for i in range(0, n, 10)]
+    gen = lambda: (x * 2 for x in nums)
+    print(f"N = {n}, лучшее из 3")
+
+    print("\nmin_max")
+    print(f"{'legacy, list':<40} {timed(legacy_min_max, nums):8.2f} ms")
+    print(f"{'new, list':<40} {timed(arrays.min_max, nums):8.2f} ms")
+    print(f"{'legacy, list(генератор)':<40} {timed(lambda: legacy_min_max(list(gen()))):8.2f} ms"
+          f" {peak(lambda: legacy_min_max(list(gen()))):8.2f} MiB")
+    print(f"{'new, генератор':<40} {timed(lambda: arrays.min_max(gen())):8.2f} ms"
+          f" {peak(lambda: arrays.min_max(gen())):8.2f} MiB")
+
+    print("\nflatten")
+    print(f"{'legacy (append)':<40} {timed(legacy_flatten, mat):8.2f} ms")
+    print(f"{'new (chain)':<40} {timed(arrays.flatten, mat):8.2f} ms")
+    print(f"{'iflatten + sum':<40} {timed(lambda: sum(arrays.iflatten(mat))):8.2f} ms"
+          f" {peak(lambda: sum(arrays.iflatten(mat))):8.2f} MiB")
+    print(f"{'legacy + sum':<40} {timed(lambda: sum(legacy_flatten(mat))):8.2f} ms"
+          f" {peak(lambda: sum(legacy_flatten(mat))):8.2f} MiB")
+    print(f"{'flatten_chunks(typecode=d) + min_max':<40}"
+          f" {timed(lambda: arrays.min_max_chunks(arrays.flatten_chunks(mat, typecode='d'))):8.2f} ms")
+
+
+def main_unique(n: int = 1_000_000) -> None:
+    print(f"\nunique_sorted, N = {n} int, ms")
+    print(f"{'диапазон':<12} {'legacy':>10} {'sorted(set)':>12} {'bitmap':>10} {'radix':>10}")
+    for span in (n // 10, n, n * 10, n * 1000):
+        nums = [random.randrange(span) for _ in range(n)]
+        row = [timed(legacy_unique_sorted, nums), timed(arrays.unique_sorted, nums)]
+        row.append(timed(bitmap_unique_sorted, nums) if span <= n * 10 else float("nan"))
+        row.append(timed(radix_unique_sorted, nums))
+        print(f"{span:<12} " + " ".join(f"{v:>{w}.1f}" for v, w in zip(row, (10, 12, 10, 10))))
+
+    if arrays.np is None:
+        print("numpy не установлен, array('q') не сравнивается")
+        return
+    ids = array("q", (random.randrange(n * 10) for _ in range(n)))
+    print(f"\narray('q'), N = {n}, диапазон {n * 10}")
+    print(f"{'min_max (numpy)':<40} {timed(arrays.min_max, ids):8.2f} ms")
+    print(f"{'min/max по array':<40} {timed(legacy_min_max, ids):8.2f} ms")
+    print(f"{'unique_sorted (numpy)':<40} {timed(arrays.unique_sorted, ids):8.2f} ms")
+    print(f"{'sorted(set(array))':<40} {timed(legacy_unique_sorted, ids):8.2f} ms")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    main(n)
+    main_unique(n)
@@ -1,21 +1,297 @@
-def transpose(mat: list[list[float | int]]) -> list[list[float | int]] | type[ValueError]:
-    if not mat:
+import math
+import os
+from array import array
+from operator import mul
+
+try:
+    import numpy as np
+except ImportError:  # numpy не обязателен — всё работает и на чистом Python
+    np = None
+
+# use_numpy: None - numpy только для входа ndarray (ответ тоже ndarray),
+# True - списки тоже гоняются через numpy (ответ списком), False - только Python
+
+def _use_numpy(mat, use_numpy: bool | None) -> bool:
+    if use_numpy is None:
+        return np is not None and isinstance(mat, np.ndarray)
+    if use_numpy and np is None:
+        raise ImportError("Для use_numpy=True нужен numpy: pip install numpy")
+    return use_numpy
+
+def _np_matrix(mat):
+    if isinstance(mat, np.ndarray):
+        return mat if mat.ndim == 2 else None
+    row_length = len(mat[0])
+    for item in mat:
+        if len(item) != row_length: return None
+    return np.asarray(mat)
+
+def _np_result(res, mat):
+    return res if isinstance(mat, np.ndarray) else res.tolist()
+
+def transpose(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[list[float | int]] | type[ValueError]:
+    if len(mat) == 0:
         return []
-    row_length = len(mat[0])    
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.T, mat)
+    row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    return [[row[i] for row in mat] for i in range(row_length)]
-def col_sum(mat: list[list[float | int]]) -> list[float] | type[ValueError]:
-    if not mat: return []
+    return [list(col) for col in zip(*mat)]
+
+def col_sum(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[float] | type[ValueError]:
+    if len(mat) == 0: return []
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.sum(axis=0), mat)
     row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    nmat = transpose(mat)
-    return [sum(arr) for arr in nmat] # type: ignore
+    # zip отдаёт столбцы по одному, полный транспонированный список не строится
+    return [sum(col) for col in zip(*mat)]
 
-def row_sum(mat: list[list[float | int]]) -> list[float] | type[ValueError]:
-    if not mat: return []
+def row_sum(mat: list[list[float | int]], use_numpy: bool | None = None) -> list[float] | type[ValueError]:
+    if len(mat) == 0: return []
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        return _np_result(arr.sum(axis=1), mat)
     row_length = len(mat[0])
     for item in mat:
         if len(item) != row_length: return ValueError
-    return [sum(arr) for arr in mat]
\ No newline at end of file
+    return list(map(sum, mat))
+
+
+# --- произведения и агрегаты -------------------------------------------------
+
+# math.sumprod (3.12+) считает скалярное произведение целиком в C
+_sumprod = getattr(math, "sumprod", None) or (lambda x, y: sum(map(mul, x, y)))
+
+def _shape(mat) -> tuple[int, int] | None:
+    row_length = len(mat[0])
+    for item in mat:
+        if len(item) != row_length: return None
+    return len(mat), row_length
+
+def dot(a: list[float | int], b: list[float | int]) -> float | type[ValueError]:
+    if len(a) != len(b): return ValueError
+    return _sumprod(a, b)
+
+def _matmul_rows(rows, bt) -> list[list[float]]:
+    return [[_sumprod(row, col) for col in bt] for row in rows]
+
+_worker_bt = None
+
+def _init_matmul_worker(bt) -> None:
+    # B^T передаётся в процесс один раз при старте, а не с каждым блоком строк
+    global _worker_bt
+    _worker_bt = bt
+
+def _matmul_block(rows) -> list[list[float]]:
+    return _matmul_rows(rows, _worker_bt)
+
+# с какого числа умножений (rows * inner * cols) пул процессов окупает свой запуск
+_POOL_MIN_OPS = 8_000_000
+
+def matmul(a: list[list[float | int]], b: list[list[float | int]], block: int = 64,
+           workers: int | None = None, use_numpy: bool | None = None) -> list[list[float]] | type[ValueError]:
+    """
+    A @ B блоками по block строк A.
+    B один раз транспонируется, и каждая ячейка — скалярное произведение
+    строки A на столбец B в C (sumprod). При workers > 1 блоки строк
+    считаются в ProcessPoolExecutor, порядок строк сохраняется.
+    workers=None - пул на os.cpu_count() процессов, только если умножений
+    не меньше _POOL_MIN_OPS; 0 или 1 - всегда в текущем процессе.
+    Несогласованные или рваные матрицы -> ValueError.
+    """
+    if len(a) == 0 or len(b) == 0:
+        return [] if len(a) == 0 else ValueError
+    if _use_numpy(a, use_numpy):
+        arr_a, arr_b = _np_matrix(a), _np_matrix(b)
+        if arr_a is None or arr_b is None or arr_a.shape[1] != arr_b.shape[0]: return ValueError
+        return _np_result(arr_a @ arr_b, a)
+    shape_a, shape_b = _shape(a), _shape(b)
+    if shape_a is None or shape_b is None or shape_a[1] != shape_b[0]: return ValueError
+    bt = list(zip(*b))
+    blocks = [a[i:i + block] for i in range(0, len(a), block)]
+    if workers is None:
+        big = shape_a[0] * shape_a[1] * shape_b[1] >= _POOL_MIN_OPS
+        workers = (os.cpu_count() or 1) if big else 1
+    if not workers or workers <= 1 or len(blocks) <= 1:
+        return [row for rows in blocks for row in _matmul_rows(rows, bt)]
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=min(workers, len(blocks)),
+                             initializer=_init_matmul_worker, initargs=(bt,)) as ex:
+        return [row for rows in ex.map(_matmul_block, blocks) for row in rows]
+
+# axis: None - по всей матрице, 0 - по столбцам, 1 - по строкам (как в numpy)
+
+def _reduce(mat, func, axis, np_name: str, use_numpy: bool | None):
+    if axis not in (None, 0, 1): return ValueError
+    if len(mat) == 0:
+        if axis is not None: return []
+        # у пустой матрицы есть только сумма
+        return 0 if func is sum else ValueError
+    if _use_numpy(mat, use_numpy):
+        arr = _np_matrix(mat)
+        if arr is None: return ValueError
+        if arr.shape[1] == 0 and axis != 0 and np_name != "sum": return ValueError
+        res = getattr(arr, np_name)(axis=axis)
+        return res.item() if axis is None else _np_result(res, mat)
+    shape = _shape(mat)
+    if shape is None: return ValueError
+    # у строк без столбцов есть только сумма (0), min/max не определены
+    if shape[1] == 0 and axis != 0 and func is not sum: return ValueError
+    if axis == 1:
+        return list(map(func, mat))
+    if axis == 0:
+        return [func(col) for col in zip(*mat)]
+    return func(map(func, mat))
+
+def mat_sum(mat, axis: int | None = None, use_numpy: bool | None = None):
+    return _reduce(mat, sum, axis, "sum", use_numpy)
+
+def mat_min(mat, axis: int | None = None, use_numpy: bool | None = None):
+    return _reduce(mat, min, axis, "min", use_numpy)
+
+def mat_max(mat, axis: int | None = None, use_numpy: bool | None = None):
+    return _reduce(mat, max, axis, "max", use_numpy)
+
+def mat_mean(mat, axis: int | None = None, use_numpy: bool | None = None):
+    if len(mat) and _use_numpy(mat, use_numpy):
+        return _reduce(mat, None, axis, "mean", use_numpy)
+    total = _reduce(mat, sum, axis, "sum", use_numpy)
+    if total is ValueError or total == []: return total
+    rows, cols = len(mat), len(mat[0]) if len(mat) else 0
+    count = rows * cols if axis is None else (rows if axis == 0 else cols)
+    if count == 0: return ValueError
+    return total / count if axis is None else [t / count for t in total]
+
+class Matrix:
+    """
+    Матрица на одном непрерывном буфере array('d') с формой и шагами (strides).
+
+    Элемент (i, j) лежит в data[i * strides[0] + j * strides[1]].
+    transpose() / .T не копирует данные: возвращает вид (view) на тот же
+    буфер с переставленными формой и шагами. row_sum / col_sum суммируют
+    каждую строку/столбец одним sum() по срезу буфера: непрерывному
+    (memoryview, без копии) или с шагом (array[start:stop:step]).
+
+    Буфер отдаётся через memoryview(m) (Python 3.12+) или m.to_memoryview()
+    как двумерный memoryview формата 'd' — только для непрерывной матрицы.
+    """
+    __slots__ = ("_data", "rows", "cols", "strides")
+
+    def __init__(self, rows: int, cols: int, data=None):
+        if rows < 0 or cols < 0:
+            raise ValueError("Размеры матрицы должны быть >= 0")
+        if data is None:
+            data = array("d", bytes(8 * rows * cols))
+        elif not isinstance(data, array) or data.typecode != "d":
+            data = array("d", data)
+        if len(data) != rows * cols:
+            raise ValueError("Размер буфера не совпадает с rows * cols")
+        self._data = data
+        self.rows = rows
+        self.cols = cols
+        self.strides = (cols, 1)
+
+    @classmethod
+    def _view(cls, data, rows: int, cols: int, strides: tuple[int, int]) -> "Matrix":
+        m = cls.__new__(cls)
+        m._data, m.rows, m.cols, m.strides = data, rows, cols, strides
+        return m
+
+    @classmethod
+    def from_lists(cls, mat: list[list[float | int]]) -> "Matrix":
+        if not mat:
+            return cls(0, 0)
+        row_length = len(mat[0])
+        for item in mat:
+            if len(item) != row_length:
+                raise ValueError("Строки матрицы разной длины")
+        data = array("d")
+        for row in mat:
+            data.extend(row)
+        return cls(len(mat), row_length, data)
+
+    def to_lists(self) -> list[list[float]]:
+        return [self._row(i).tolist() for i in range(self.rows)]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.rows, self.cols)
+
+    @property
+    def is_contiguous(self) -> bool:
+        return self.strides == (self.cols, 1)
+
+    def _row(self, i: int) -> array:
+        s0, s1 = self.strides
+        start = i * s0
+        return self._data[start:start + (self.cols - 1) * s1 + 1:s1] if self.cols else array("d")
+
+    def _col(self, j: int) -> array:
+        s0, s1 = self.strides
+        start = j * s1
+        return self._data[start:start + (self.rows - 1) * s0 + 1:s0] if self.rows else array("d")
+
+    def __getitem__(self, idx: tuple[int, int]) -> float:
+        i, j = idx
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Индекс вне матрицы")
+        return self._data[i * self.strides[0] + j * self.strides[1]]
+
+    def __setitem__(self, idx: tuple[int, int], value: float) -> None:
+        i, j = idx
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Индекс вне матрицы")
+        self._data[i * self.strides[0] + j * self.strides[1]] = value
+
+    def transpose(self) -> "Matrix":
+        return Matrix._view(self._data, self.cols, self.rows, self.strides[::-1])
+
+    T = property(transpose)
+
+    def copy(self) -> "Matrix":
+        """Непрерывная копия (в том числе из транспонированного вида)"""
+        data = array("d")
+        for i in range(self.rows):
+            data.extend(self._row(i))
+        return Matrix(self.rows, self.cols, data)
+
+    def _lines_sum(self, n: int, length: int, step: int) -> list[float]:
+        # n отрезков длины length подряд, i-й начинается с i * step
+        view = memoryview(self._data)
+        return [sum(view[i * step:i * step + length]) for i in range(n)]
+
+    def row_sum(self) -> list[float]:
+        s0, s1 = self.strides
+        if s1 == 1:
+            return self._lines_sum(self.rows, self.cols, s0)
+        return [sum(self._row(i)) for i in range(self.rows)]
+
+    def col_sum(self) -> list[float]:
+        s0, s1 = self.strides
+        if s0 == 1:
+            return self._lines_sum(self.cols, self.rows, s1)
+        # срез array с шагом собирается в C, это быстрее поэлементного
+        # накопления по строкам в Python
+        return [sum(self._col(j)) for j in range(self.cols)]
+
+    def to_memoryview(self) -> memoryview:
+        if not self.is_contiguous:
+            raise BufferError("Вид не непрерывный, сначала .copy()")
+        view = memoryview(self._data)
+        if self.rows == 0 or self.cols == 0:
+            return view
+        return view.cast("B").cast("d", (self.rows, self.cols))
+
+    def __buffer__(self, flags: int) -> memoryview:
+        return self.to_memoryview()
+
+    def __repr__(self) -> str:
+        return f"Matrix({self.rows}x{self.cols}, {self.to_lists()!r})"
@@ -0,0 +1,86 @@
+"""Бенчмарк matrix.py: старый вариант на вложенных comprehension,
+новый чистый Python (zip), класс Matrix на array('d') и numpy (если установлен).
+Вторая часть — matmul в GFLOP/s (2 * n^3 операций) для разных размеров:
+тройной цикл, matmul в одном процессе, matmul на пуле процессов, numpy.
+
+Запуск:
+    python matrix_bench.py [N]   # матрица N x N, по умолчанию 1000
+"""
+
+import os
+import random
+import sys
+import time
+
+import matrix
+
+
+def legacy_transpose(mat):
+    return [[row[i] for row in mat] for i in range(len(mat[0]))]
+
+
+def legacy_col_sum(mat):
+    return [sum(arr) for arr in legacy_transpose(mat)]
+
+
+def timed(func, *args, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(n: int = 1000) -> None:
+    mat = [[float(i * n + j) for j in range(n)] for i in range(n)]
+    print(f"Матрица {n} x {n}, лучшее из 3, ms")
+    print(f"{'':<12} {'comprehension':>14} {'python zip':>12} {'Matrix':>12} {'numpy':>12}")
+    arr = matrix.np.asarray(mat) if matrix.np is not None else None
+    flat = matrix.Matrix.from_lists(mat)
+    rows = (
+        ("transpose", legacy_transpose, matrix.transpose, matrix.Matrix.transpose),
+        ("col_sum", legacy_col_sum, matrix.col_sum, matrix.Matrix.col_sum),
+        ("row_sum", lambda m: [sum(r) for r in m], matrix.row_sum, matrix.Matrix.row_sum),
+        ("T.col_sum", lambda m: legacy_col_sum(legacy_transpose(m)),
+         lambda m: matrix.col_sum(matrix.transpose(m)), lambda m: m.T.col_sum()),
+    )
+    for name, legacy, func, method in rows:
+        t_old = timed(legacy, mat)
+        t_py = timed(func, mat)
+        t_flat = timed(method, flat)
+        t_np = f"{timed(func, arr):12.2f}" if arr is not None else f"{'нет numpy':>12}"
+        print(f"{name:<12} {t_old:14.2f} {t_py:12.2f} {t_flat:12.2f} {t_np}")
+
+
+def legacy_matmul(a, b):
+    n, m, p = len(a), len(b), len(b[0])
+    return [[sum(a[i][k] * b[k][j] for k in range(m)) for j in range(p)] for i in range(n)]
+
+
+def main_matmul(sizes=(64, 128, 256, 512)) -> None:
+    workers = os.cpu_count() or 1
+    print(f"\nmatmul n x n, GFLOP/s (процессов в пуле: {workers})")
+    print(f"{'n':>6} {'тройной цикл':>14} {'matmul':>10} {'пул':>10} {'numpy':>10}")
+    for n in sizes:
+        a = [[random.random() for _ in range(n)] for _ in range(n)]
+        b = [[random.random() for _ in range(n)] for _ in range(n)]
+        flop = 2 * n ** 3
+
+        def gflops(func, *args) -> str:
+            return f"{flop / timed(func, *args, repeat=1) / 1e6:10.3f}"
+
+        legacy = gflops(legacy_matmul, a, b) if n <= 256 else f"{'-':>10}"
+        single = gflops(lambda x, y: matrix.matmul(x, y, workers=1), a, b)
+        pooled = gflops(lambda x, y: matrix.matmul(x, y, block=max(1, n // workers), workers=workers), a, b)
+        if matrix.np is not None:
+            arr_a, arr_b = matrix.np.asarray(a), matrix.np.asarray(b)
+            fast = gflops(matrix.matmul, arr_a, arr_b)
+        else:
+            fast = f"{'нет numpy':>10}"
+        print(f"{n:>6} {legacy:>14} {single} {pooled} {fast}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000)
+    main_matmul()
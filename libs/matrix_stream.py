@@ -0,0 +1,203 @@
+"""
+Матрицы, которые не помещаются в память.
+
+- stream_row_sum / stream_col_sum — суммы по итератору строк за один
+  последовательный проход; кроме ответа в памяти держится одна строка.
+- Формат .mtrx: заголовок + row-major float64, читается через mmap
+  (MappedMatrix), пишется потоково (write_matrix_file).
+- csv_to_matrix — потоковый конвертер CSV -> .mtrx; CSV читается так же,
+  как в libs.conver (utf-8, newline="", csv.reader, ValueError на плохой ввод).
+"""
+import csv
+import mmap
+import struct
+import sys
+from array import array
+from operator import add
+from pathlib import Path
+from typing import Iterable, Iterator
+
+try:
+    from .matrix import Matrix
+except ImportError:  # libs/ лежит прямо в sys.path (скрипты и бенчмарки в libs/)
+    from matrix import Matrix
+
+# magic, версия, резерв, rows, cols — 24 байта, данные выровнены на 8
+_HEADER = struct.Struct("<4sHHQQ")
+_MAGIC = b"MTRX"
+_VERSION = 1
+
+
+def stream_row_sum(rows: Iterable[Iterable[float | int]]) -> list[float] | type[ValueError]:
+    out = []
+    row_length = None
+    for row in rows:
+        row = row if isinstance(row, (list, tuple, array, memoryview)) else list(row)
+        if row_length is None:
+            row_length = len(row)
+        elif len(row) != row_length:
+            return ValueError
+        out.append(sum(row))
+    return out
+
+
+def stream_col_sum(rows: Iterable[Iterable[float | int]]) -> list[float] | type[ValueError]:
+    acc = None
+    for row in rows:
+        row = row if isinstance(row, (list, tuple, array, memoryview)) else list(row)
+        if acc is None:
+            acc = list(row)
+            continue
+        if len(row) != len(acc):
+            return ValueError
+        acc = list(map(add, acc, row))
+    return [] if acc is None else acc
+
+
+def write_matrix_file(path: str | Path, rows: Iterable[Iterable[float | int]]) -> tuple[int, int]:
+    """
+    Потоково пишет строки в .mtrx. Возвращает (rows, cols).
+    Рваные строки -> ValueError (файл при этом остаётся недописанным).
+    """
+    p = Path(path)
+    if p.parent and not p.parent.exists():
+        p.parent.mkdir(parents=True, exist_ok=True)
+    n_rows, n_cols = 0, None
+    with p.open("wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, 0, 0, 0))
+        for row in rows:
+            buf = array("d", row)
+            if n_cols is None:
+                n_cols = len(buf)
+            elif len(buf) != n_cols:
+                raise ValueError("Строки матрицы разной длины")
+            if sys.byteorder != "little":
+                buf.byteswap()
+            buf.tofile(f)
+            n_rows += 1
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, _VERSION, 0, n_rows, n_cols or 0))
+    return n_rows, n_cols or 0
+
+
+class MappedMatrix:
+    """
+    Матрица из файла .mtrx, отображённого в память (mmap, только чтение).
+    Данные подкачивает ОС по мере обращения, в памяти процесса их нет.
+
+    Методы:
+      - row(i) -> memoryview        без копии
+      - iter_rows()                 строки по порядку
+      - row_sum(), col_sum()        один последовательный проход по файлу
+      - to_matrix() -> Matrix       загрузка целиком
+      - close(), with ... as m      строки row() должны быть освобождены до close()
+    """
+    __slots__ = ("rows", "cols", "_file", "_mm", "_view")
+
+    def __init__(self, path: str | Path):
+        if sys.byteorder != "little":
+            raise ValueError("MappedMatrix поддерживает только little-endian платформы")
+        self._file = open(path, "rb")
+        try:
+            head = self._file.read(_HEADER.size)
+            if len(head) != _HEADER.size:
+                raise ValueError("Файл матрицы повреждён: нет заголовка")
+            magic, version, _, self.rows, self.cols = _HEADER.unpack(head)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Неверный формат файла матрицы")
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            if len(self._mm) != _HEADER.size + 8 * self.rows * self.cols:
+                raise ValueError("Файл матрицы повреждён: неверный размер")
+            self._view = memoryview(self._mm)[_HEADER.size:].cast("d")
+        except Exception:
+            self.close()
+            raise
+
+    def row(self, i: int) -> memoryview:
+        if not 0 <= i < self.rows:
+            raise IndexError("Индекс строки вне матрицы")
+        return self._view[i * self.cols:(i + 1) * self.cols]
+
+    def iter_rows(self) -> Iterator[memoryview]:
+        view, cols = self._view, self.cols
+        for i in range(self.rows):
+            yield view[i * cols:(i + 1) * cols]
+
+    def row_sum(self) -> list[float]:
+        return stream_row_sum(self.iter_rows())  # type: ignore
+
+    def col_sum(self) -> list[float]:
+        if self.rows == 0:
+            return []
+        return stream_col_sum(self.iter_rows())  # type: ignore
+
+    def to_matrix(self) -> Matrix:
+        return Matrix(self.rows, self.cols, array("d", self._view))
+
+    def close(self) -> None:
+        """
+        Закрывает отображение и файл. Файл закрывается всегда.
+        Если живы memoryview из row()/iter_rows(), mmap закрыть нельзя:
+        BufferError, отображение остаётся открытым - после освобождения
+        строк (del / release()) close() можно вызвать повторно.
+        """
+        try:
+            view = getattr(self, "_view", None)
+            if view is not None:
+                view.release()
+                self._view = None
+            mm = getattr(self, "_mm", None)
+            if mm is not None:
+                try:
+                    mm.close()
+                except BufferError:
+                    raise BufferError("MappedMatrix.close: сначала освободите строки из row()/iter_rows()") from None
+                self._mm = None
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "MappedMatrix":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedMatrix({self.rows}x{self.cols})"
+
+
+def iter_csv_rows(csv_path: str | Path, header: bool = True) -> Iterator[list[float]]:
+    """
+    Строки CSV как list[float], по одной.
+    header=True — первая строка заголовок и пропускается.
+    Не число в ячейке / ошибка CSV -> ValueError.
+    """
+    cp = Path(csv_path)
+    if cp.suffix.lower() != ".csv":
+        raise ValueError("Неверный тип входного файла: ожидался .csv")
+    with cp.open("r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        try:
+            if header and next(reader, None) is None:
+                raise ValueError("CSV без заголовка или пустой")
+            for line_no, raw in enumerate(reader, start=2 if header else 1):
+                if not raw:
+                    continue
+                try:
+                    yield [float(cell) for cell in raw]
+                except ValueError:
+                    raise ValueError(f"Строка {line_no}: ожидались числа") from None
+        except csv.Error as e:
+            raise ValueError(f"Ошибка при чтении CSV: {e}")
+
+
+def csv_to_matrix(csv_path: str | Path, out_path: str | Path, header: bool = True) -> tuple[int, int]:
+    """
+    Конвертирует числовой CSV в .mtrx, не загружая его целиком.
+    Возвращает (rows, cols). Ошибки: расширение, пустой CSV,
+    не числа, строки разной длины -> ValueError.
+    """
+    op = Path(out_path)
+    if op.suffix.lower() != ".mtrx":
+        raise ValueError("Неверный тип выходного файла: ожидался .mtrx")
+    return write_matrix_file(op, iter_csv_rows(csv_path, header))
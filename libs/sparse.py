@@ -0,0 +1,239 @@
+"""
+Разреженные матрицы: хранятся только ненулевые элементы (nnz).
+
+- COOMatrix — тройки (row, col, value); удобно собирать и транспонировать.
+- CSRMatrix — строки подряд: indptr[i]:indptr[i + 1] — срез indices/data
+  для строки i; удобно для row_sum и доступа по строкам.
+
+transpose / row_sum / col_sum работают за O(nnz + rows + cols): нули не
+перебираются. Полные списки строятся только в from_dense / to_dense.
+Индексы лежат в array('q'), значения — в list (int остаются int).
+"""
+from array import array
+from bisect import bisect_left
+from itertools import compress, repeat
+
+
+def _check_dense(mat: list[list[float | int]]) -> tuple[int, int]:
+    if len(mat) == 0:
+        return 0, 0
+    row_length = len(mat[0])
+    for item in mat:
+        if len(item) != row_length:
+            raise ValueError("Строки матрицы разной длины")
+    return len(mat), row_length
+
+
+def _counting_order(keys: array, n: int) -> tuple[array, array]:
+    """
+    Устойчивая сортировка подсчётом позиций 0..len(keys)-1 по keys (0 <= key < n).
+    Возвращает (indptr, order): indptr[k]:indptr[k + 1] — позиции с ключом k.
+    """
+    indptr = array("q", bytes(8 * (n + 1)))
+    for k in keys:
+        indptr[k + 1] += 1
+    for k in range(n):
+        indptr[k + 1] += indptr[k]
+    nxt = array("q", indptr)
+    order = array("q", bytes(8 * len(keys)))
+    for pos, k in enumerate(keys):
+        order[nxt[k]] = pos
+        nxt[k] += 1
+    return indptr, order
+
+
+class COOMatrix:
+    """
+    Разреженная матрица в формате координат (COO).
+
+    Методы:
+      - from_dense(mat) / to_dense()
+      - transpose() / .T    O(1): меняются местами массивы индексов
+      - row_sum(), col_sum()  O(nnz + rows/cols)
+      - to_csr()            O(nnz + rows)
+      - shape, nnz
+    """
+    __slots__ = ("rows", "cols", "row_idx", "col_idx", "data")
+
+    def __init__(self, rows: int, cols: int, row_idx=(), col_idx=(), data=()):
+        if rows < 0 or cols < 0:
+            raise ValueError("Размеры матрицы должны быть >= 0")
+        self.rows = rows
+        self.cols = cols
+        self.row_idx = row_idx if isinstance(row_idx, array) else array("q", row_idx)
+        self.col_idx = col_idx if isinstance(col_idx, array) else array("q", col_idx)
+        self.data = data if isinstance(data, list) else list(data)
+        if not len(self.row_idx) == len(self.col_idx) == len(self.data):
+            raise ValueError("row_idx, col_idx и data разной длины")
+        for i, j in zip(self.row_idx, self.col_idx):
+            if not (0 <= i < rows and 0 <= j < cols):
+                raise IndexError("Индекс вне матрицы")
+
+    @classmethod
+    def from_dense(cls, mat: list[list[float | int]]) -> "COOMatrix":
+        rows, cols = _check_dense(mat)
+        m = cls(rows, cols)
+        for i, row in enumerate(mat):
+            nz = list(compress(range(cols), row))
+            m.row_idx.extend(repeat(i, len(nz)))
+            m.col_idx.extend(nz)
+            m.data.extend(map(row.__getitem__, nz))
+        return m
+
+    def to_dense(self) -> list[list[float | int]]:
+        out = [[0] * self.cols for _ in range(self.rows)]
+        for i, j, v in zip(self.row_idx, self.col_idx, self.data):
+            out[i][j] += v
+        return out
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.rows, self.cols)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def transpose(self) -> "COOMatrix":
+        m = COOMatrix.__new__(COOMatrix)
+        m.rows, m.cols = self.cols, self.rows
+        m.row_idx, m.col_idx, m.data = self.col_idx, self.row_idx, self.data
+        return m
+
+    T = property(transpose)
+
+    @staticmethod
+    def _sums(idx: array, data: list, n: int) -> list[float | int]:
+        out = [0] * n
+        for k, v in zip(idx, data):
+            out[k] += v
+        return out
+
+    def row_sum(self) -> list[float | int]:
+        return self._sums(self.row_idx, self.data, self.rows)
+
+    def col_sum(self) -> list[float | int]:
+        return self._sums(self.col_idx, self.data, self.cols)
+
+    def to_csr(self) -> "CSRMatrix":
+        indptr, order = _counting_order(self.row_idx, self.rows)
+        col_idx, data = self.col_idx, self.data
+        return CSRMatrix._raw(self.rows, self.cols, indptr,
+                              array("q", map(col_idx.__getitem__, order)),
+                              list(map(data.__getitem__, order)))
+
+    def __repr__(self) -> str:
+        return f"COOMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
+
+
+class CSRMatrix:
+    """
+    Разреженная матрица по строкам (CSR).
+
+    Методы:
+      - from_dense(mat) / to_dense()
+      - transpose() / .T    O(nnz + cols), результат тоже CSR
+      - row_sum(), col_sum()  O(nnz + rows/cols)
+      - row(i) -> (indices, data) ненулевых элементов строки
+      - m[i, j]             бинарный поиск внутри строки
+      - to_coo(), shape, nnz
+    Индексы столбцов внутри строки идут по возрастанию.
+    """
+    __slots__ = ("rows", "cols", "indptr", "indices", "data")
+
+    def __init__(self, rows: int, cols: int):
+        if rows < 0 or cols < 0:
+            raise ValueError("Размеры матрицы должны быть >= 0")
+        self.rows = rows
+        self.cols = cols
+        self.indptr = array("q", bytes(8 * (rows + 1)))
+        self.indices = array("q")
+        self.data = []
+
+    @classmethod
+    def _raw(cls, rows: int, cols: int, indptr: array, indices: array, data: list) -> "CSRMatrix":
+        m = cls.__new__(cls)
+        m.rows, m.cols = rows, cols
+        m.indptr, m.indices, m.data = indptr, indices, data
+        return m
+
+    @classmethod
+    def from_dense(cls, mat: list[list[float | int]]) -> "CSRMatrix":
+        rows, cols = _check_dense(mat)
+        indptr, indices, data = array("q", [0]), array("q"), []
+        for row in mat:
+            nz = list(compress(range(cols), row))
+            indices.extend(nz)
+            data.extend(map(row.__getitem__, nz))
+            indptr.append(len(data))
+        return cls._raw(rows, cols, indptr, indices, data)
+
+    def to_dense(self) -> list[list[float | int]]:
+        out = []
+        indptr, indices, data = self.indptr, self.indices, self.data
+        for i in range(self.rows):
+            row = [0] * self.cols
+            for k in range(indptr[i], indptr[i + 1]):
+                row[indices[k]] = data[k]
+            out.append(row)
+        return out
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return (self.rows, self.cols)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.data)
+
+    def row(self, i: int) -> tuple[array, list]:
+        if not 0 <= i < self.rows:
+            raise IndexError("Индекс строки вне матрицы")
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        return self.indices[start:stop], self.data[start:stop]
+
+    def __getitem__(self, idx: tuple[int, int]) -> float | int:
+        i, j = idx
+        if not (0 <= i < self.rows and 0 <= j < self.cols):
+            raise IndexError("Индекс вне матрицы")
+        start, stop = self.indptr[i], self.indptr[i + 1]
+        k = bisect_left(self.indices, j, start, stop)
+        return self.data[k] if k < stop and self.indices[k] == j else 0
+
+    def transpose(self) -> "CSRMatrix":
+        # CSR транспонированной = перестановка подсчётом по номерам столбцов;
+        # устойчивость сохраняет возрастание индексов внутри новых строк
+        indptr, order = _counting_order(self.indices, self.cols)
+        old_rows = self._row_idx()
+        data = self.data
+        return CSRMatrix._raw(self.cols, self.rows, indptr,
+                              array("q", map(old_rows.__getitem__, order)),
+                              list(map(data.__getitem__, order)))
+
+    T = property(transpose)
+
+    def _row_idx(self) -> array:
+        out = array("q")
+        indptr = self.indptr
+        for i in range(self.rows):
+            out.extend(repeat(i, indptr[i + 1] - indptr[i]))
+        return out
+
+    def row_sum(self) -> list[float | int]:
+        indptr, data = self.indptr, self.data
+        return [sum(data[indptr[i]:indptr[i + 1]]) for i in range(self.rows)]
+
+    def col_sum(self) -> list[float | int]:
+        out = [0] * self.cols
+        for j, v in zip(self.indices, self.data):
+            out[j] += v
+        return out
+
+    def to_coo(self) -> COOMatrix:
+        m = COOMatrix.__new__(COOMatrix)
+        m.rows, m.cols = self.rows, self.cols
+        m.row_idx, m.col_idx, m.data = self._row_idx(), array("q", self.indices), list(self.data)
+        return m
+
+    def __repr__(self) -> str:
+        return f"CSRMatrix({self.rows}x{self.cols}, nnz={self.nnz})"
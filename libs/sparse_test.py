@@ -0,0 +1,44 @@
+import random
+import matrix
+from sparse import *
+
+# COOMatrix / CSRMatrix против плотных функций из matrix
+dense = [[0, 2, 0, 0], [1, 0, 0, 3], [0, 0, 0, 0]]
+coo = COOMatrix.from_dense(dense)
+csr = CSRMatrix.from_dense(dense)
+print('Testing COOMatrix')
+print(f"{dense} Out:", coo, coo.shape, coo.nnz)
+print("transpose Out:", coo.T.to_dense(), "| matrix.transpose:", matrix.transpose(dense))
+print("row_sum Out:", coo.row_sum(), "| matrix.row_sum:", matrix.row_sum(dense))
+print("col_sum Out:", coo.col_sum(), "| matrix.col_sum:", matrix.col_sum(dense))
+print("to_csr Out:", coo.to_csr(), list(coo.to_csr().indptr), list(coo.to_csr().indices))
+
+print('\nTesting CSRMatrix')
+print(f"{dense} Out:", csr, list(csr.indptr), list(csr.indices), csr.data)
+print("[1, 3] Out:", csr[1, 3], "[2, 0] Out:", csr[2, 0], "row(1) Out:", csr.row(1))
+print("transpose Out:", csr.T.to_dense(), list(csr.T.indptr))
+print("row_sum Out:", csr.row_sum(), "col_sum Out:", csr.col_sum())
+print("to_coo Out:", coo.to_csr().to_coo().to_dense() == dense)
+print("[] Out:", COOMatrix.from_dense([]).to_dense(), CSRMatrix.from_dense([]).to_dense())
+for bad in (lambda: CSRMatrix.from_dense([[1, 2], [3]]), lambda: csr[3, 0], lambda: COOMatrix(2, 2, [0], [2], [1])):
+    try:
+        bad()
+        print("Out: нет ошибки")
+    except (IndexError, ValueError) as e:
+        print(f"Out: {type(e).__name__}: {e}")
+
+print('\nTesting random matrices')
+rng = random.Random(7)
+for _ in range(200):
+    rows, cols = rng.randint(1, 12), rng.randint(1, 12)
+    density = rng.random()
+    mat = [[rng.randint(-9, 9) if rng.random() < density else 0 for _ in range(cols)] for _ in range(rows)]
+    coo, csr = COOMatrix.from_dense(mat), CSRMatrix.from_dense(mat)
+    for m in (coo, csr, coo.to_csr(), csr.to_coo()):
+        assert m.to_dense() == mat and m.shape == (rows, cols)
+        assert m.T.to_dense() == matrix.transpose(mat)
+        assert m.row_sum() == matrix.row_sum(mat) and m.col_sum() == matrix.col_sum(mat)
+    assert csr.T.T.to_dense() == mat
+    assert coo.to_csr().to_dense() == csr.to_dense() and list(coo.to_csr().indptr) == list(csr.indptr)
+    assert csr.nnz == coo.nnz == sum(v != 0 for row in mat for v in row)
+print("200 случайных матриц Out: COO, CSR и COO<->CSR совпадают с transpose/row_sum/col_sum")
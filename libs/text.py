@@ -43,7 +43,9 @@ def count_freq(tokens: list[str])-> dict[str, int]:
     Returns:
         dict[str, int]: Словарь, где ключ — слово, значение — количество его вхождений.
     """
-    return {word: tokens.count(word) for word in set(tokens)}
+    from collections import Counter
+    # один проход вместо tokens.count на каждое слово (было O(n * словарь))
+    return dict(Counter(tokens))
 
 def top_n(freq: dict[str, int], n: int = 5) -> list[tuple[str, int]]:
     """
@@ -58,4 +60,343 @@ def top_n(freq: dict[str, int], n: int = 5) -> list[tuple[str, int]]:
     Returns:
         list[tuple[str, int]]: Список кортежей (слово, частота), отсортированный по убыванию частоты.
     """
-    return sorted(freq.items(), key=lambda item: (-item[1], item[0]))[:n]
\ No newline at end of file
+    return sorted(freq.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+
+def iter_token_chunks(stream, chunk_size: int = 1 << 16):
+    """
+    Читает поток кусками по chunk_size и выдаёт токены каждого куска списком
+    (как tokenize, но без чтения всего текста в память).
+
+    Слово, разрезанное границей куска, не теряется: хвост после последнего
+    пробельного символа переносится в следующий кусок, а токены пробелов
+    не содержат. Память — один кусок плюс самое длинное слово.
+
+    Args:
+        stream: Текстовый поток с методом read (например, sys.stdin).
+        chunk_size (int, optional): Размер куска в символах. По умолчанию 65536.
+
+    Yields:
+        list[str]: Токены очередного куска.
+    """
+    import re
+    word = re.compile(r"\w+(?:-\w+)*")
+    tail = ""
+    while chunk := stream.read(chunk_size):
+        buf = tail + chunk
+        # rsplit с конца доходит только до последнего пробела
+        tail = "" if buf[-1].isspace() else buf.rsplit(None, 1)[-1]
+        end = len(buf) - len(tail)
+        if end == 0:
+            continue
+        yield word.findall(buf, 0, end)
+    if tail:
+        yield word.findall(tail)
+
+
+def iter_tokens(stream, chunk_size: int = 1 << 16):
+    """
+    Лениво выдаёт токены потока по одному (см. iter_token_chunks).
+
+    Args:
+        stream: Текстовый поток с методом read.
+        chunk_size (int, optional): Размер куска в символах. По умолчанию 65536.
+
+    Yields:
+        str: Очередной токен.
+    """
+    from itertools import chain
+    return chain.from_iterable(iter_token_chunks(stream, chunk_size))
+
+
+class WordStats:
+    """
+    Статистика слов за один проход.
+
+    Поддерживается на лету:
+      - total   — всего слов,
+      - distinct — различных слов,
+      - hapax   — слов, встретившихся ровно один раз,
+    top(n) — как top_n(freq, n), но через heapq без полной сортировки.
+
+    update() лучше кормить пачками токенов (iter_token_chunks): пачка
+    считается Counter в C, а словарь и hapax обновляются по различным словам.
+    Память — словарь частот, то есть размер словаря, а не объём текста.
+    """
+    __slots__ = ("total", "hapax", "freq")
+
+    def __init__(self):
+        self.total = 0
+        self.hapax = 0
+        self.freq: dict[str, int] = {}
+
+    def update(self, tokens) -> None:
+        from collections import Counter
+        from itertools import repeat
+        from operator import add, countOf
+        batch = Counter(tokens)
+        # старые и новые частоты слов пачки считаются map-ами в C;
+        # hapax: +слова с новой частотой 1, -слова со старой частотой 1
+        old = list(map(self.freq.get, batch, repeat(0)))
+        new = list(map(add, old, batch.values()))
+        self.freq.update(zip(batch, new))
+        self.total += batch.total()
+        self.hapax += countOf(new, 1) - countOf(old, 1)
+
+    @property
+    def distinct(self) -> int:
+        return len(self.freq)
+
+    def top(self, n: int = 5) -> list[tuple[str, int]]:
+        import heapq
+        return heapq.nsmallest(n, self.freq.items(), key=lambda item: (-item[1], item[0]))
+
+
+# --- приближённые оценки для бесконечных потоков ------------------------------
+#
+# Память фиксирована и задаётся параметрами, а не размером словаря.
+# Хеш — blake2b без соли: одинаковый во всех процессах (в отличие от hash()),
+# поэтому эскизы, собранные на разных воркерах, можно сливать через merge().
+
+def _hash128(token: str) -> tuple[int, int]:
+    import hashlib
+    digest = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little")
+
+
+class CountMinSketch:
+    """
+    Count-Min Sketch: частота любого слова в таблице depth x width счётчиков.
+
+    Гарантии (N — сумма всех добавленных частот):
+      - оценка никогда не меньше истинной частоты;
+      - с вероятностью >= 1 - delta оценка <= истинная + eps * N,
+        где eps = e / width, delta = e ** -depth.
+    Память — 8 * width * depth байт. from_error(eps, delta) подбирает размеры.
+
+    Args:
+        width (int, optional): Счётчиков в строке. По умолчанию 2048 (eps ~ 0.0013).
+        depth (int, optional): Число строк (хешей). По умолчанию 5 (delta ~ 0.7%).
+    """
+    __slots__ = ("width", "depth", "total", "_table")
+
+    def __init__(self, width: int = 2048, depth: int = 5):
+        from array import array
+        if width <= 0 or depth <= 0:
+            raise ValueError("width и depth должны быть > 0")
+        self.width = width
+        self.depth = depth
+        self.total = 0
+        self._table = array("q", bytes(8 * width * depth))
+
+    @classmethod
+    def from_error(cls, eps: float, delta: float) -> "CountMinSketch":
+        import math
+        return cls(math.ceil(math.e / eps), math.ceil(math.log(1 / delta)))
+
+    def _cells(self, h1: int, h2: int) -> list[int]:
+        # d хешей из двух: h1 + i * h2 (Kirsch–Mitzenmacher)
+        width = self.width
+        return [i * width + (h1 + i * h2) % width for i in range(self.depth)]
+
+    def add(self, token: str, count: int = 1) -> None:
+        self._add_hashed(*_hash128(token), count)
+
+    def _add_hashed(self, h1: int, h2: int, count: int) -> None:
+        table = self._table
+        for cell in self._cells(h1, h2):
+            table[cell] += count
+        self.total += count
+
+    def estimate(self, token: str) -> int:
+        return self._estimate_hashed(*_hash128(token))
+
+    def _estimate_hashed(self, h1: int, h2: int) -> int:
+        return min(map(self._table.__getitem__, self._cells(h1, h2)))
+
+    def merge(self, other: "CountMinSketch") -> "CountMinSketch":
+        """Складывает другой эскиз тех же размеров в этот (как по объединённому потоку)"""
+        from operator import add
+        from array import array
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("Эскизы разных размеров нельзя слить")
+        self._table = array("q", map(add, self._table, other._table))
+        self.total += other.total
+        return self
+
+
+class SpaceSaving:
+    """
+    Space-Saving: k отслеживаемых слов-кандидатов в «тяжёлые» (heavy hitters).
+
+    Новое слово при заполненном наборе вытесняет слово с минимальным счётчиком m
+    и получает счётчик m + count с ошибкой error = m.
+    Гарантии (N — сумма частот):
+      - count - error <= истинная частота <= count, error <= N / k;
+      - любое слово с частотой > N / k обязательно отслеживается.
+    Минимум ищется по куче с ленивым обновлением: O(log k) амортизированно.
+
+    Args:
+        k (int, optional): Сколько слов отслеживать. По умолчанию 1000.
+    """
+    __slots__ = ("k", "total", "counts", "errors", "_heap")
+
+    def __init__(self, k: int = 1000):
+        if k <= 0:
+            raise ValueError("k должен быть > 0")
+        self.k = k
+        self.total = 0
+        self.counts: dict[str, int] = {}
+        self.errors: dict[str, int] = {}
+        # (счётчик, слово); счётчик в куче может отставать от counts
+        self._heap: list[tuple[int, str]] = []
+
+    def add(self, token: str, count: int = 1) -> None:
+        import heapq
+        counts = self.counts
+        self.total += count
+        if token in counts:
+            counts[token] += count
+            return
+        if len(counts) < self.k:
+            counts[token] = count
+            self.errors[token] = 0
+            heapq.heappush(self._heap, (count, token))
+            return
+        heap = self._heap
+        while True:
+            low, victim = heap[0]
+            current = counts[victim]
+            if current == low:
+                break
+            heapq.heapreplace(heap, (current, victim))
+        del counts[victim], self.errors[victim]
+        counts[token] = low + count
+        self.errors[token] = low
+        heapq.heapreplace(heap, (low + count, token))
+
+    def _floor(self) -> int:
+        # верхняя граница частоты любого неотслеживаемого слова
+        return min(self.counts.values()) if len(self.counts) == self.k else 0
+
+    def top(self, n: int = 5) -> list[tuple[str, int]]:
+        import heapq
+        return heapq.nsmallest(n, self.counts.items(), key=lambda item: (-item[1], item[0]))
+
+    def merge(self, other: "SpaceSaving") -> "SpaceSaving":
+        """
+        Сливает другой набор в этот. Отсутствующее в наборе слово считается
+        с его минимальным счётчиком (больше оно встретиться не могло).
+        Гарантия после слияния та же: error <= (N1 + N2) / k.
+        """
+        import heapq
+        floor_a, floor_b = self._floor(), other._floor()
+        merged = {}
+        for token in self.counts.keys() | other.counts.keys():
+            merged[token] = (self.counts.get(token, floor_a) + other.counts.get(token, floor_b),
+                             self.errors.get(token, floor_a) + other.errors.get(token, floor_b))
+        keep = heapq.nlargest(self.k, merged.items(), key=lambda item: item[1][0])
+        self.counts = {token: c for token, (c, _) in keep}
+        self.errors = {token: e for token, (_, e) in keep}
+        self._heap = [(c, token) for token, c in self.counts.items()]
+        heapq.heapify(self._heap)
+        self.total += other.total
+        return self
+
+
+class HyperLogLog:
+    """
+    HyperLogLog: число различных слов по 2 ** p регистрам по байту.
+
+    Стандартная ошибка оценки ~ 1.04 / sqrt(2 ** p): при p = 14 (16 КиБ)
+    это ~0.8%, при p = 10 (1 КиБ) ~3.3%. Для малых значений применяется
+    поправка linear counting, 64-битный хеш делает поправку для больших
+    значений ненужной.
+
+    Args:
+        p (int, optional): Точность, 4..18. По умолчанию 14.
+    """
+    __slots__ = ("p", "_registers")
+
+    def __init__(self, p: int = 14):
+        if not 4 <= p <= 18:
+            raise ValueError("p должен быть от 4 до 18")
+        self.p = p
+        self._registers = bytearray(1 << p)
+
+    def add(self, token: str) -> None:
+        self._add_hashed(_hash128(token)[0])
+
+    def _add_hashed(self, h: int) -> None:
+        rest_bits = 64 - self.p
+        idx = h >> rest_bits
+        rank = rest_bits - (h & ((1 << rest_bits) - 1)).bit_length() + 1
+        if rank > self._registers[idx]:
+            self._registers[idx] = rank
+
+    def estimate(self) -> int:
+        import math
+        m = len(self._registers)
+        alpha = {16: 0.673, 32: 0.697, 64: 0.709}.get(m, 0.7213 / (1 + 1.079 / m))
+        raw = alpha * m * m / math.fsum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if raw <= 2.5 * m and zeros:
+            return round(m * math.log(m / zeros))
+        return round(raw)
+
+    def merge(self, other: "HyperLogLog") -> "HyperLogLog":
+        """Регистры — поэлементный максимум: оценка как по объединению потоков"""
+        if self.p != other.p:
+            raise ValueError("HyperLogLog с разным p нельзя слить")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+
+class SketchStats:
+    """
+    Приближённый аналог WordStats с фиксированной памятью:
+      - total    — всего слов (точно),
+      - distinct — различных слов (HyperLogLog),
+      - top(n)   — кандидаты Space-Saving, частота каждого — минимум из
+                   оценок Space-Saving и Count-Min (обе не занижают).
+    hapax этими эскизами не оценивается.
+
+    Args:
+        width, depth: Размеры CountMinSketch.
+        k (int, optional): Размер SpaceSaving. По умолчанию 1000.
+        p (int, optional): Точность HyperLogLog. По умолчанию 14.
+    """
+    __slots__ = ("total", "cms", "heavy", "hll")
+
+    def __init__(self, width: int = 2048, depth: int = 5, k: int = 1000, p: int = 14):
+        self.total = 0
+        self.cms = CountMinSketch(width, depth)
+        self.heavy = SpaceSaving(k)
+        self.hll = HyperLogLog(p)
+
+    def update(self, tokens) -> None:
+        from collections import Counter
+        batch = Counter(tokens)
+        add_cms, add_hll, add_heavy = self.cms._add_hashed, self.hll._add_hashed, self.heavy.add
+        for token, n in batch.items():
+            h1, h2 = _hash128(token)
+            add_cms(h1, h2, n)
+            add_hll(h1)
+            add_heavy(token, n)
+        self.total += batch.total()
+
+    @property
+    def distinct(self) -> int:
+        return self.hll.estimate()
+
+    def top(self, n: int = 5) -> list[tuple[str, int]]:
+        estimate = self.cms.estimate
+        counts = [(token, min(c, estimate(token))) for token, c in self.heavy.counts.items()]
+        return sorted(counts, key=lambda item: (-item[1], item[0]))[:n]
+
+    def merge(self, other: "SketchStats") -> "SketchStats":
+        self.cms.merge(other.cms)
+        self.heavy.merge(other.heavy)
+        self.hll.merge(other.hll)
+        self.total += other.total
+        return self
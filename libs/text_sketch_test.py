@@ -0,0 +1,78 @@
+import math
+import random
+from collections import Counter
+from text import *
+
+# Эскизы по частям потока + merge против одного эскиза и точного Counter
+rng = random.Random(1)
+vocab = [f"w{i}" for i in range(20_000)]
+weights = [1 / (i + 1) for i in range(len(vocab))]  # закон Ципфа
+stream = rng.choices(vocab, weights, k=200_000)
+exact = Counter(stream)
+parts = [stream[i::4] for i in range(4)]
+N = len(stream)
+
+print('Testing CountMinSketch')
+whole = CountMinSketch(width=1024, depth=4)
+merged = CountMinSketch(width=1024, depth=4)
+for token, n in exact.items():
+    whole.add(token, n)
+for part in parts:
+    sketch = CountMinSketch(width=1024, depth=4)
+    for token in part:
+        sketch.add(token)
+    merged.merge(sketch)
+eps = math.e / whole.width
+over = [merged.estimate(t) - c for t, c in exact.items()]
+print("merge 4 частей == эскиз всего потока Out:", merged._table == whole._table, merged.total == N)
+print("оценка >= истинной для всех слов Out:", min(over) >= 0)
+print(f"доля слов с ошибкой > eps * N ({eps * N:.0f}) Out: {sum(d > eps * N for d in over) / len(over):.4f}")
+try:
+    merged.merge(CountMinSketch(width=512, depth=4))
+except ValueError as e:
+    print("merge разных размеров Out: ValueError:", e)
+
+print('\nTesting SpaceSaving')
+k = 200
+merged = SpaceSaving(k)
+for part in parts:
+    heavy = SpaceSaving(k)
+    for token in part:
+        heavy.add(token)
+    merged.merge(heavy)
+bounds_ok = all(c - merged.errors[t] <= exact[t] <= c for t, c in merged.counts.items())
+print("count - error <= истинная <= count Out:", bounds_ok)
+print(f"max error <= N / k ({N // k}) Out:", max(merged.errors.values()) <= N / k)
+print("все слова с частотой > N / k отслеживаются Out:",
+      all(t in merged.counts for t, c in exact.items() if c > N / k))
+print("top(5) Out:", merged.top(5))
+print("точный top 5 Out:", exact.most_common(5))
+
+print('\nTesting HyperLogLog')
+whole = HyperLogLog(p=12)
+merged = HyperLogLog(p=12)
+for token in exact:
+    whole.add(token)
+for part in parts:
+    hll = HyperLogLog(p=12)
+    for token in part:
+        hll.add(token)
+    merged.merge(hll)
+err = abs(merged.estimate() - len(exact)) / len(exact)
+print("merge 4 частей == HLL всего потока Out:", merged._registers == whole._registers)
+print(f"различных {len(exact)}, оценка {merged.estimate()}, ошибка {err:.3%} (3 сигмы {3 * 1.04 / 64:.3%}) Out:",
+      err <= 3 * 1.04 / 64)
+small = HyperLogLog(p=12)
+for token in vocab[:100]:
+    small.add(token)
+print("100 различных (linear counting) Out:", small.estimate())
+
+print('\nTesting SketchStats')
+stats = SketchStats(width=1024, depth=4, k=200, p=12)
+for part in parts:
+    s = SketchStats(width=1024, depth=4, k=200, p=12)
+    s.update(part)
+    stats.merge(s)
+print("total Out:", stats.total, "| точно:", N)
+print("distinct Out:", stats.distinct, "| точно:", len(exact))
+print("top(3) Out:", stats.top(3), "| точно:", exact.most_common(3))